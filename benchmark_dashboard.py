@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+benchmark_dashboard.py
+
+Micro-benchmarks for the data engines behind project_dashboard.py.
+Run all benchmarks with `python benchmark_dashboard.py`, or a single one
+with e.g. `python benchmark_dashboard.py merge`.
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import cycling_routes
+import project_data
+import project_timeline
+import route_analytics
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def timed(func, *args, repeat=3):
+    """Return the best wall-clock time of `repeat` calls, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def make_projects(n_rows, seed=0):
+    """Build a synthetic projects frame shaped like 'Projects - full.csv'."""
+    rng = np.random.default_rng(seed)
+    # Fewer distinct names than rows, so a good share of the rows are duplicates
+    n_names = max(1, int(n_rows * 0.85))
+    names = rng.integers(0, n_names, n_rows)
+    texts = np.array(['', 'Short', 'A somewhat longer value', 'An even longer, detailed description'], dtype=object)
+    return pd.DataFrame({
+        'Unnamed: 0': np.arange(n_rows),
+        'Project Name': pd.Series(names).map(lambda i: f"Project {i}"),
+        'Category': rng.choice(['AI/ML', 'SaaS', 'Tools', 'DevOps', None], n_rows),
+        'Status': rng.choice(['Active', 'In Progress', 'Planning'], n_rows),
+        'Priority': rng.choice(['High', 'Medium', 'Low'], n_rows),
+        'Tech Stack': rng.choice(['Python', 'TypeScript/React', 'Next.js', None], n_rows),
+        'Last Updated': rng.choice(['2024-01', '2024-02', '2025-03'], n_rows),
+        'Résumé_Détaillé': texts[rng.integers(0, len(texts), n_rows)],
+    })
+
+
+def bench_merge():
+    """Scaling of the groupby-based duplicate merge from 1k to 1M rows."""
+    print("merge_duplicate_projects")
+    print(f"{'rows':>10} {'duplicates':>11} {'seconds':>9} {'µs/row':>8}")
+    for n_rows in SIZES:
+        df = make_projects(n_rows)
+        n_dups = int(df['Project Name'].duplicated(keep=False).sum())
+        seconds = timed(project_data.merge_duplicate_projects, df)
+        print(f"{n_rows:>10} {n_dups:>11} {seconds:>9.3f} {seconds / n_rows * 1e6:>8.2f}")
+
+
+def _legacy_legend_flags(timeline_df):
+    """The per-row legend scan of the former timeline loop (quadratic)."""
+    flags = []
+    for idx, row in timeline_df.iterrows():
+        status = row.get('Status', 'Unknown')
+        flags.append(idx == next((i for i, r in timeline_df.iterrows() if r.get('Status') == status), None))
+    return flags
+
+
+def bench_timeline():
+    """Timeline figure build time: linear builder vs. the former legend scan."""
+    print("build_timeline_figure")
+    print(f"{'rows':>10} {'traces':>7} {'seconds':>9} {'µs/row':>8}")
+    for n_rows in SIZES[:3]:
+        timeline_df = project_timeline.prepare_timeline_data(make_projects(n_rows, seed=1))
+        fig = project_timeline.build_timeline_figure(timeline_df)
+        seconds = timed(project_timeline.build_timeline_figure, timeline_df)
+        print(f"{n_rows:>10} {len(fig.data):>7} {seconds:>9.3f} {seconds / n_rows * 1e6:>8.2f}")
+
+    print("former per-row legend scan (legend flags only)")
+    print(f"{'rows':>10} {'seconds':>9} {'µs/row':>8}")
+    for n_rows in (250, 500, 1_000):
+        timeline_df = project_timeline.prepare_timeline_data(make_projects(n_rows, seed=1))
+        seconds = timed(_legacy_legend_flags, timeline_df, repeat=1)
+        print(f"{n_rows:>10} {seconds:>9.3f} {seconds / n_rows * 1e6:>8.2f}")
+
+
+def make_route(n_points, seed=0):
+    """Build a synthetic 1 Hz ride as a route dict (see route_files.py)."""
+    rng = np.random.default_rng(seed)
+    heading = np.cumsum(rng.normal(0, 0.05, n_points))
+    step = rng.uniform(0, 1.5e-4, n_points)
+    return {
+        'lat': (45 + np.cumsum(step * np.cos(heading))).astype(np.float32),
+        'lon': (6 + np.cumsum(step * np.sin(heading))).astype(np.float32),
+        'ele': (500 + np.cumsum(rng.normal(0, 0.3, n_points))).astype(np.float32),
+        'time': np.datetime64('2024-06-01T08:00:00', 'ns') + np.arange(n_points).astype('timedelta64[s]'),
+    }
+
+
+def bench_routes():
+    """Route analytics and map simplification time, from 1k to 1M GPS points."""
+    print("analyze_route / map_points")
+    print(f"{'points':>10} {'analytics s':>12} {'simplify s':>11} {'map points':>11}")
+    for n_points in SIZES:
+        route = make_route(n_points)
+        analytics = timed(route_analytics.analyze_route, route)
+        simplify = timed(cycling_routes.map_points, route['lat'], route['lon'])
+        n_drawn = len(cycling_routes.map_points(route['lat'], route['lon']))
+        print(f"{n_points:>10} {analytics:>12.3f} {simplify:>11.3f} {n_drawn:>11}")
+
+
+BENCHMARKS = {
+    'merge': bench_merge,
+    'timeline': bench_timeline,
+    'routes': bench_routes,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark '{name}'. Available: {', '.join(BENCHMARKS)}")
+            sys.exit(1)
+        BENCHMARKS[name]()
+        print()
+
+
+if __name__ == "__main__":
+    main()
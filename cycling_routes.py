@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+cycling_routes.py
+
+GPS track ingestion for the "Cycling Activity Routes" section of
+project_dashboard.py.
+
+Uploaded CSV files are read in chunks, keeping only the needed columns, with
+lat/lon stored as float32. The distance/duration totals are accumulated in
+the same pass. Before rendering, tracks are simplified with
+Ramer-Douglas-Peucker, using a tolerance scaled to the track's extent (about
+one pixel of a map that shows the whole route), then decimated evenly if
+still above MAX_MAP_POINTS. The browser therefore never receives more than a
+few thousand points.
+
+GPX, TCX and FIT files are parsed by route_files.py. load_route() parses any
+supported upload into the same route dict and caches it by content hash, so
+re-uploading the same ride is instant.
+"""
+
+import hashlib
+import io
+import struct
+import threading
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from cachetools import LRUCache
+
+import route_files
+
+# Rows read per chunk when streaming an upload
+GPS_CHUNK_ROWS = 100_000
+
+# Maximum number of points sent to the map
+MAX_MAP_POINTS = 5000
+
+# Simplification tolerance, as a fraction of the track's extent
+SIMPLIFY_TOLERANCE = 1 / 2000
+
+# Optional columns summed into the track totals
+TOTAL_COLUMNS = ('distance', 'duration')
+
+# Optional per-point columns of GPS CSVs, used by route_analytics.py
+POINT_COLUMNS = ('ele', 'time')
+
+# Route file types accepted by the uploader
+ROUTE_FILE_TYPES = ('csv', 'gpx', 'tcx', 'fit')
+
+# Number of parsed routes kept in memory
+ROUTE_CACHE_SIZE = 8
+
+_route_cache = LRUCache(maxsize=ROUTE_CACHE_SIZE)
+_route_lock = threading.Lock()
+
+
+def read_gps_csv(csv_file, chunk_rows=GPS_CHUNK_ROWS):
+    """Stream a GPS CSV (lat, lon and optional ele, time, distance/duration columns).
+
+    Returns a route dict (see route_files.py) with 'lat' and 'lon' as float32
+    arrays (rows with missing coordinates dropped), 'ele' and 'time' when
+    those columns exist, and 'totals': the sums of the distance/duration
+    columns, or None for missing columns. Raises ValueError if lat/lon are
+    missing.
+    """
+    header = pd.read_csv(csv_file, nrows=0).columns
+    if hasattr(csv_file, 'seek'):
+        csv_file.seek(0)
+    if 'lat' not in header or 'lon' not in header:
+        raise ValueError("Uploaded file must contain 'lat' and 'lon' columns.")
+
+    total_columns = [col for col in TOTAL_COLUMNS if col in header]
+    point_columns = [col for col in POINT_COLUMNS if col in header]
+    dtypes = {'lat': np.float32, 'lon': np.float32, 'ele': np.float32, 'time': object}
+    dtypes.update({col: np.float64 for col in total_columns})
+    usecols = ['lat', 'lon'] + point_columns + total_columns
+
+    chunks = {col: [] for col in ['lat', 'lon'] + point_columns}
+    totals = {col: 0.0 if col in total_columns else None for col in TOTAL_COLUMNS}
+    for chunk in pd.read_csv(csv_file, usecols=usecols,
+                             dtype={col: dtypes[col] for col in usecols}, chunksize=chunk_rows):
+        for col in total_columns:
+            totals[col] += float(chunk[col].sum())
+        located = chunk['lat'].notna().to_numpy() & chunk['lon'].notna().to_numpy()
+        for col in chunks:
+            values = chunk[col]
+            if col == 'time':
+                values = pd.to_datetime(values, utc=True, errors='coerce', format='ISO8601').dt.tz_localize(None)
+            chunks[col].append(values.to_numpy()[located])
+
+    empty = {'lat': np.float32, 'lon': np.float32, 'ele': np.float32, 'time': 'datetime64[ns]'}
+    route = {col: np.concatenate(parts) if parts else np.empty(0, dtype=empty[col]) for col, parts in chunks.items()}
+    route.setdefault('ele', None)
+    route.setdefault('time', None)
+    route['totals'] = totals
+    return route
+
+
+def _parse_route(data, suffix):
+    if suffix == '.gpx':
+        return route_files.parse_gpx(io.BytesIO(data))
+    if suffix == '.tcx':
+        return route_files.parse_tcx(io.BytesIO(data))
+    if suffix == '.fit':
+        return route_files.parse_fit(data)
+    return read_gps_csv(io.BytesIO(data))
+
+
+def load_route(data, file_name):
+    """Parse an uploaded route file (CSV, GPX, TCX or FIT, given as bytes).
+
+    Routes are cached by the SHA-256 of their content; the returned dict,
+    which also holds that 'hash', is shared and must not be modified.
+    Raises ValueError for unreadable files.
+    """
+    key = hashlib.sha256(data).hexdigest()
+    with _route_lock:
+        route = _route_cache.get(key)
+    if route is not None:
+        return route
+
+    suffix = Path(file_name).suffix.lower()
+    try:
+        route = _parse_route(data, suffix)
+    except (ET.ParseError, struct.error, IndexError) as e:
+        raise ValueError(f"Could not read {file_name}: {e}") from e
+    route.setdefault('totals', dict.fromkeys(TOTAL_COLUMNS))
+    route['hash'] = key
+
+    with _route_lock:
+        _route_cache[key] = route
+    return route
+
+
+def rdp_mask(x, y, epsilon):
+    """Boolean mask of the points kept by Ramer-Douglas-Peucker at tolerance `epsilon`.
+
+    Iterative (no recursion limit); the distances of each segment's points
+    are computed with numpy.
+    """
+    n = len(x)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        dx, dy = x[end] - x[start], y[end] - y[start]
+        px, py = x[start + 1:end] - x[start], y[start + 1:end] - y[start]
+        norm = np.hypot(dx, dy)
+        if norm > 0:
+            distances = np.abs(dx * py - dy * px) / norm
+        else:
+            distances = np.hypot(px, py)
+        i = int(np.argmax(distances))
+        if distances[i] > epsilon:
+            split = start + 1 + i
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return keep
+
+
+def simplify_track(lat, lon, max_points=MAX_MAP_POINTS, tolerance=SIMPLIFY_TOLERANCE):
+    """Indices of the points to draw for a track, at most `max_points` of them."""
+    n = len(lat)
+    if n <= max_points:
+        return np.arange(n)
+
+    # Pre-decimate very long tracks so RDP works on a bounded number of points
+    candidates = np.arange(n)
+    if n > max_points * 50:
+        candidates = np.unique(np.linspace(0, n - 1, max_points * 50).astype(np.int64))
+
+    # Equirectangular projection: longitude degrees shrink with latitude
+    y = lat[candidates].astype(np.float64)
+    x = lon[candidates].astype(np.float64) * np.cos(np.radians(np.nanmean(y)))
+    extent = max(np.ptp(x), np.ptp(y))
+    kept = candidates[rdp_mask(x, y, extent * tolerance)]
+
+    if len(kept) > max_points:
+        kept = kept[np.unique(np.linspace(0, len(kept) - 1, max_points).astype(np.int64))]
+    return kept
+
+
+def map_points(lat, lon, max_points=MAX_MAP_POINTS):
+    """Simplified track as a frame ready for st.map."""
+    kept = simplify_track(lat, lon, max_points)
+    # st.map serializes the view center with json, which rejects float32 scalars
+    return pd.DataFrame({'lat': lat[kept].astype(np.float64), 'lon': lon[kept].astype(np.float64)})
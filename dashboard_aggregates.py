@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+dashboard_aggregates.py
+
+Overview metrics and chart aggregates for project_dashboard.py.
+
+Aggregates are computed once per data version and kept in an in-process
+cache keyed by a content fingerprint of the projects frame, so Streamlit
+reruns (triggered by any widget interaction) only do a dictionary lookup.
+"""
+
+import hashlib
+import threading
+
+import pandas as pd
+from cachetools import LRUCache
+
+# Number of data versions kept in the cache
+MAX_CACHED_VERSIONS = 4
+
+_cache = LRUCache(maxsize=MAX_CACHED_VERSIONS)
+_cache_lock = threading.Lock()
+
+
+def row_hashes(data):
+    """One 64-bit content hash per row of a Series or DataFrame, as a uint64 array."""
+    try:
+        return pd.util.hash_pandas_object(data, index=False).to_numpy()
+    except TypeError:
+        # Mixed-type object columns: hash their string form instead
+        return pd.util.hash_pandas_object(data.astype(str), index=False).to_numpy()
+
+
+def frame_fingerprint(df):
+    """Return a SHA-256 content hash of a DataFrame (columns, dtypes and values)."""
+    digest = hashlib.sha256()
+    digest.update(repr(list(df.columns)).encode('utf-8'))
+    digest.update(repr([str(dtype) for dtype in df.dtypes]).encode('utf-8'))
+    for col in df.columns:
+        digest.update(row_hashes(df[col]).tobytes())
+    return digest.hexdigest()
+
+
+def _counts_frame(series, label):
+    """value_counts() as a two-column frame, without empty categorical levels."""
+    counts = series.value_counts()
+    counts = counts[counts > 0].reset_index()
+    counts.columns = [label, 'Count']
+    return counts
+
+
+def compute_aggregates(df, tech_table):
+    """Compute every overview metric and chart aggregate of the dashboard.
+
+    `tech_table` is the normalized project/technology table of `df` (see
+    project_data.build_technology_table).
+    """
+    aggregates = {
+        'total_projects': len(df),
+        'active_projects': int((df['Status'] == 'Active').sum()) if 'Status' in df.columns else 0,
+        'high_priority': int((df['Priority'] == 'High').sum()) if 'Priority' in df.columns else 0,
+        'unique_categories': int(df['Category'].nunique()) if 'Category' in df.columns else 0,
+        'status_counts': None,
+        'category_counts': None,
+        'tech_counts': None,
+        'project_technologies': {},
+    }
+    if 'Status' in df.columns:
+        aggregates['status_counts'] = _counts_frame(df['Status'], 'Status')
+    if 'Category' in df.columns:
+        aggregates['category_counts'] = _counts_frame(df['Category'], 'Category')
+    if 'Tech Stack' in df.columns:
+        aggregates['tech_counts'] = _counts_frame(tech_table['Technology'], 'Technology')
+        # Canonical technologies of each project (by row position), for the project cards
+        aggregates['project_technologies'] = tech_table.groupby('row', sort=False)['Technology'].agg(', '.join).to_dict()
+    return aggregates
+
+
+def get_aggregates(df, tech_table, key):
+    """Return the aggregates of `df`, computing them only once per `key`.
+
+    `key` is the content fingerprint of `df` (see frame_fingerprint). The
+    returned dict is shared between reruns and sessions and must not be
+    modified by callers.
+    """
+    with _cache_lock:
+        aggregates = _cache.get(key)
+    if aggregates is None:
+        aggregates = compute_aggregates(df, tech_table)
+        with _cache_lock:
+            _cache[key] = aggregates
+    return aggregates
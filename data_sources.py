@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+data_sources.py
+
+Registry of the CSV files project_dashboard.py can load its data from.
+
+The main data file is configured explicitly (DASHBOARD_DATA_FILE, defaulting
+to 'Projects - full.csv'). Other CSV files matching DASHBOARD_DATA_GLOBS in
+the same directory are kept in a small fallback index that is built once and
+then kept up to date by a watchdog observer, so resolving the data source
+never has to scan the filesystem again.
+
+The same observer maintains a data version counter, bumped whenever one of
+these files changes on disk. The dashboard keys its caches on that version
+instead of expiring them on a timer.
+"""
+
+import fnmatch
+import logging
+import os
+import threading
+from pathlib import Path
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+DEFAULT_DATA_FILE = 'Projects - full.csv'
+DEFAULT_FALLBACK_GLOBS = '*.csv'
+
+
+class _DataDirHandler(FileSystemEventHandler):
+    """Bump the data version (and drop the fallback index) on relevant events."""
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def _path(self, path):
+        return Path(os.fsdecode(path))
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.registry.file_changed(self._path(event.src_path), listing_changed=True)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self.registry.file_changed(self._path(event.src_path), listing_changed=True)
+
+    def on_moved(self, event):
+        # Atomic saves (write to a temp file, then rename) end up here
+        if not event.is_directory:
+            self.registry.file_changed(self._path(event.src_path), listing_changed=True)
+            self.registry.file_changed(self._path(event.dest_path), listing_changed=True)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.registry.file_changed(self._path(event.src_path))
+
+    def on_closed(self, event):
+        # Emitted once a writer closes the file, i.e. when the content is complete
+        if not event.is_directory:
+            self.registry.file_changed(self._path(event.src_path))
+
+
+class DataSourceRegistry:
+    """Resolve the project data file and its fallbacks without walking the tree."""
+
+    def __init__(self, data_file=None, fallback_globs=None):
+        data_file = data_file or os.environ.get('DASHBOARD_DATA_FILE', DEFAULT_DATA_FILE)
+        fallback_globs = fallback_globs if fallback_globs is not None else \
+            os.environ.get('DASHBOARD_DATA_GLOBS', DEFAULT_FALLBACK_GLOBS)
+        if isinstance(fallback_globs, str):
+            fallback_globs = [g.strip() for g in fallback_globs.split(',') if g.strip()]
+
+        self.data_file = Path(data_file)
+        self.data_dir = self.data_file.parent
+        self._resolved_dir = self.data_dir.resolve()
+        self.fallback_globs = list(fallback_globs)
+        self._index = None
+        self._version = 0
+        self._lock = threading.Lock()
+        self._observer = None
+
+    @property
+    def version(self):
+        """Counter bumped every time a data file changes on disk."""
+        return self._version
+
+    def is_data_file(self, path):
+        """Whether a path is the main data file."""
+        return path.name == self.data_file.name and path.parent.resolve() == self._resolved_dir
+
+    def matches_fallback(self, path):
+        """Whether a path belongs in the fallback index."""
+        if path.name == self.data_file.name or path.parent.resolve() != self._resolved_dir:
+            return False
+        return any(fnmatch.fnmatch(path.name, pattern) for pattern in self.fallback_globs)
+
+    def invalidate(self):
+        """Forget the fallback index; it is rebuilt on next use."""
+        with self._lock:
+            self._index = None
+
+    def file_changed(self, path, listing_changed=False):
+        """Record a change to `path`, reported by the watchdog observer.
+
+        Changes to the main data file or to a fallback file bump the data
+        version; files appearing or disappearing also drop the fallback index.
+        """
+        is_fallback = self.matches_fallback(path)
+        if not (is_fallback or self.is_data_file(path)):
+            return
+        with self._lock:
+            if listing_changed and is_fallback:
+                self._index = None
+            self._version += 1
+
+    def fallback_files(self):
+        """Return the cached list of fallback CSV files, building it if needed."""
+        with self._lock:
+            if self._index is None:
+                found = set()
+                for pattern in self.fallback_globs:
+                    found.update(p for p in self.data_dir.glob(pattern)
+                                 if p.is_file() and p.name != self.data_file.name)
+                self._index = sorted(found)
+            return list(self._index)
+
+    def candidates(self):
+        """Return the files to try, in order: the main data file, then fallbacks."""
+        files = [self.data_file] if self.data_file.is_file() else []
+        return files + self.fallback_files()
+
+    def start_watching(self):
+        """Start the watchdog observer keeping the index and data version up to date."""
+        if self._observer is not None or not self.data_dir.is_dir():
+            return
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_DataDirHandler(self), str(self.data_dir), recursive=False)
+            observer.start()
+            self._observer = observer
+        except Exception as e:
+            # Without the observer, changes are only picked up after a restart
+            logging.warning(f"Could not watch {self.data_dir} for data file changes: {e}")
+
+    def stop_watching(self):
+        """Stop the watchdog observer, if running."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
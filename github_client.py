@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+github_client.py
+
+HTTP access to GitHub for project_dashboard.py.
+
+GitHubURLValidator checks that a repository URL exists without blocking the
+Streamlit script thread: requests go through one pooled requests.Session,
+run on a small background thread pool, and their results are kept in a TTL
+cache. check() answers immediately ('valid', 'invalid' or 'pending'); a
+pending URL is answered by a later rerun.
+
+GitHubMetadataFetcher fills the Stars / Forks / Open Issues panel of the
+project cards. Repository stats are fetched concurrently from the REST API
+with conditional requests (ETag / If-None-Match) and tenacity retries, and
+kept in a JSON cache on disk with a TTL, so cards render from the cache and
+only stale entries are refreshed, in the background.
+
+Base URLs are configurable (GITHUB_API_URL for the API), so both classes can
+be pointed at a local stub HTTP server.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+GITHUB_WEB_URL = "https://github.com/"
+GITHUB_API_URL = os.environ.get('GITHUB_API_URL', "https://api.github.com/")
+
+# On-disk cache of repository stats, next to the other dashboard caches
+METADATA_CACHE_FILE = Path('.dashboard_cache') / 'github_metadata.json'
+
+VALID = 'valid'
+INVALID = 'invalid'
+PENDING = 'pending'
+
+
+def make_session(pool_size=8):
+    """requests.Session with a connection pool of `pool_size` per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class GitHubURLValidator:
+    """Background, cached validation of GitHub repository URLs."""
+
+    def __init__(self, base_url=GITHUB_WEB_URL, session=None, timeout=2,
+                 ttl=3600, max_entries=1024, max_workers=4):
+        self.base_url = base_url if base_url.endswith('/') else base_url + '/'
+        self.session = session or make_session(max_workers)
+        self.timeout = timeout
+        self._results = TTLCache(maxsize=max_entries, ttl=ttl)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='github-validate')
+
+    def has_valid_format(self, url):
+        """Whether `url` points below the GitHub base URL."""
+        return bool(url) and url.startswith(self.base_url) and len(url) > len(self.base_url)
+
+    def validate(self, url):
+        """Check synchronously that the repository exists ('valid' or 'invalid')."""
+        if not self.has_valid_format(url):
+            return INVALID
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            return VALID if response.status_code < 400 else INVALID
+        except requests.RequestException:
+            return VALID  # If can't connect, still accept the URL
+
+    def _run(self, url):
+        status = self.validate(url)
+        with self._lock:
+            self._results[url] = status
+            self._pending.pop(url, None)
+        return status
+
+    def status(self, url):
+        """Cached status of `url`, 'pending' while being checked, or None if never checked."""
+        with self._lock:
+            status = self._results.get(url)
+            if status is None and url in self._pending:
+                return PENDING
+            return status
+
+    def check(self, url):
+        """Return the status of `url` without blocking, starting a check if needed."""
+        if not self.has_valid_format(url):
+            return INVALID
+        with self._lock:
+            status = self._results.get(url)
+            if status is not None:
+                return status
+            if url not in self._pending:
+                self._pending[url] = self._executor.submit(self._run, url)
+        return PENDING
+
+    def wait(self, url, timeout=None):
+        """Block until the check of `url` finishes and return its status."""
+        with self._lock:
+            future = self._pending.get(url)
+        if future is not None:
+            future.result(timeout)
+        return self.status(url)
+
+
+class TransientGitHubError(Exception):
+    """Server error or rate limit: the request is worth retrying."""
+
+
+def repo_path(url):
+    """'owner/repo' part of a GitHub repository URL, or None."""
+    parts = [part for part in urlparse(url).path.split('/') if part]
+    if len(parts) < 2:
+        return None
+    return f"{parts[0]}/{parts[1].removesuffix('.git')}"
+
+
+class GitHubMetadataFetcher:
+    """Stars, forks and open issues of repositories, cached on disk with a TTL.
+
+    Cache entries are {'etag', 'fetched_at', 'stats'}, keyed by 'owner/repo';
+    'stats' is None for repositories the API does not know.
+    """
+
+    def __init__(self, cache_file=METADATA_CACHE_FILE, api_url=GITHUB_API_URL,
+                 token=None, ttl=3600, retry_after=60, max_workers=8, timeout=5, session=None):
+        self.cache_file = Path(cache_file)
+        self.api_url = api_url if api_url.endswith('/') else api_url + '/'
+        self.token = token if token is not None else os.environ.get('GITHUB_TOKEN')
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.session = session or make_session(max_workers)
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._failed_at = {}
+        self._refresh = None
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='github-metadata')
+
+    def _load(self):
+        try:
+            with open(self.cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        with self._lock:
+            payload = json.dumps(self._entries)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(payload)
+        os.replace(tmp_file, self.cache_file)
+
+    def cached_stats(self, urls):
+        """Cached stats of each URL ({url: stats}), without any network access."""
+        with self._lock:
+            entries = {url: self._entries.get(repo_path(url)) for url in urls}
+        return {url: entry['stats'] for url, entry in entries.items() if entry and entry['stats']}
+
+    def _stale_repos(self, urls):
+        now = time.time()
+        repos = {repo_path(url) for url in urls} - {None}
+        return sorted(repo for repo in repos
+                      if now - self._failed_at.get(repo, 0) > self.retry_after and
+                      (repo not in self._entries or now - self._entries[repo]['fetched_at'] > self.ttl))
+
+    def stale_repos(self, urls):
+        """Repositories of `urls` missing from the cache or older than the TTL.
+
+        Repositories whose last fetch failed are skipped for `retry_after` seconds.
+        """
+        with self._lock:
+            return self._stale_repos(urls)
+
+    @retry(retry=retry_if_exception_type((TransientGitHubError, requests.ConnectionError, requests.Timeout)),
+           stop=stop_after_attempt(3), wait=wait_exponential(multiplier=0.5, max=4), reraise=True)
+    def _request(self, repo, etag):
+        headers = {'Accept': 'application/vnd.github+json'}
+        if etag:
+            headers['If-None-Match'] = etag
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        response = self.session.get(f"{self.api_url}repos/{repo}", headers=headers, timeout=self.timeout)
+        if response.status_code >= 500 or response.status_code == 429:
+            raise TransientGitHubError(f"{repo}: HTTP {response.status_code}")
+        return response
+
+    def _fetch(self, repo):
+        """Fetch one repository and update its cache entry; False if it could not be fetched."""
+        with self._lock:
+            entry = self._entries.get(repo)
+        response = self._request(repo, entry['etag'] if entry else None)
+        if response.status_code == 304:
+            # Not modified: conditional requests do not count against the rate limit
+            entry = dict(entry, fetched_at=time.time())
+        elif response.status_code == 200:
+            data = response.json()
+            entry = {
+                'etag': response.headers.get('ETag'),
+                'fetched_at': time.time(),
+                'stats': {
+                    'stars': data.get('stargazers_count'),
+                    'forks': data.get('forks_count'),
+                    'open_issues': data.get('open_issues_count'),
+                },
+            }
+        elif response.status_code == 404:
+            entry = {'etag': None, 'fetched_at': time.time(), 'stats': None}
+        else:
+            # Forbidden (rate limit) or other client errors: keep the old entry, retry later
+            return False
+        with self._lock:
+            self._entries[repo] = entry
+        return True
+
+    def refresh(self, urls):
+        """Fetch the stale repositories of `urls` concurrently and save the cache."""
+        repos = self.stale_repos(urls)
+        if not repos:
+            return 0
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='github-fetch') as executor:
+            results = list(executor.map(self._fetch_quietly, repos))
+        self._save()
+        return sum(results)
+
+    def _fetch_quietly(self, repo):
+        try:
+            fetched = self._fetch(repo)
+        except (requests.RequestException, TransientGitHubError, ValueError):
+            fetched = False
+        if not fetched:
+            with self._lock:
+                self._failed_at[repo] = time.time()
+        return fetched
+
+    def refresh_in_background(self, urls):
+        """Start a refresh of `urls` unless one is running or nothing is stale; returns immediately."""
+        urls = list(urls)
+        with self._lock:
+            if self._refresh is not None and not self._refresh.done():
+                return self._refresh
+            if not self._stale_repos(urls):
+                return None
+            self._refresh = self._refresh_executor.submit(self.refresh, urls)
+            return self._refresh
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+github_links.py
+
+Store of the project -> GitHub repository links of project_dashboard.py.
+
+Links live in a small SQLite database (github_repos.db) in WAL mode: saving
+a link is a single-row upsert in its own transaction, readers never block
+writers, and a crash cannot leave a truncated file behind. Reads are served
+from an in-process copy of the table, reloaded only when the database files'
+modification times change (i.e. when any process wrote to them).
+
+Links of the former github_repos.json are imported on first use.
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+LINKS_DB_FILE = Path("github_repos.db")
+LEGACY_JSON_FILE = Path("github_repos.json")
+
+
+class GitHubLinkStore:
+    """Project name -> repository URL store with atomic single-key upserts."""
+
+    def __init__(self, db_path=LINKS_DB_FILE, legacy_json=LEGACY_JSON_FILE):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._links = {}
+        self._stamp = None
+        new_db = not self.db_path.exists()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS links (project TEXT PRIMARY KEY, url TEXT NOT NULL)")
+        if new_db and legacy_json is not None:
+            self._import_json(Path(legacy_json))
+
+    @contextmanager
+    def _connect(self):
+        """Connection whose statements run in one transaction, committed on exit."""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _import_json(self, json_file):
+        try:
+            with open(json_file, 'r') as f:
+                links = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self._connect() as conn:
+            conn.executemany("INSERT OR IGNORE INTO links (project, url) VALUES (?, ?)",
+                             [(str(project), str(url)) for project, url in links.items()])
+
+    def _file_stamp(self):
+        """Modification times and sizes of the database and its write-ahead log."""
+        stamp = []
+        for path in (self.db_path, self.db_path.with_name(self.db_path.name + '-wal')):
+            try:
+                stat = path.stat()
+                stamp.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def all(self):
+        """Every link as a {project: url} dict, shared between callers (do not modify)."""
+        stamp = self._file_stamp()
+        with self._lock:
+            if stamp == self._stamp:
+                return self._links
+        with self._connect() as conn:
+            links = dict(conn.execute("SELECT project, url FROM links"))
+        with self._lock:
+            self._links, self._stamp = links, stamp
+        return links
+
+    def get(self, project):
+        """Repository URL of a project, or None."""
+        return self.all().get(project)
+
+    def set(self, project, url):
+        """Link (or re-link) a project to a repository URL."""
+        with self._connect() as conn:
+            conn.execute("INSERT INTO links (project, url) VALUES (?, ?) "
+                         "ON CONFLICT(project) DO UPDATE SET url = excluded.url", (project, url))
+
+    def delete(self, project):
+        """Remove the link of a project, if any."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM links WHERE project = ?", (project,))
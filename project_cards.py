@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+project_cards.py
+
+HTML rendering of the project cards shown in the Project Details section of
+project_dashboard.py, and of the GitHub-styled buttons.
+
+Cards are paginated: only the projects of the visible page are rendered,
+and the cards of a category are emitted as a single HTML block instead of
+several Streamlit elements per project. Rendered cards are kept in an LRU
+fragment cache keyed by (row hash, GitHub link), so unchanged cards cost a
+dictionary lookup on rerun. The GitHub button CSS is injected once per page
+(GITHUB_BUTTON_CSS) rather than repeated in every button.
+"""
+
+import threading
+from html import escape
+
+import pandas as pd
+from cachetools import LRUCache
+
+import dashboard_aggregates
+
+# Number of project cards rendered per page
+CARDS_PER_PAGE = 20
+
+# Maximum number of rendered cards kept in the fragment cache
+FRAGMENT_CACHE_SIZE = 4096
+
+_fragment_cache = LRUCache(maxsize=FRAGMENT_CACHE_SIZE)
+_fragment_lock = threading.Lock()
+
+# Define GitHub logo as SVG
+github_logo = "<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"24\" height=\"24\" viewBox=\"0 0 24 24\" fill=\"#24292e\">" + \
+    "<path d=\"M12 0c-6.626 0-12 5.373-12 12 0 5.302 3.438 9.8 8.207 11.387.599.111.793-.261.793-.577v-2.234c-3.338.726-4.033-1.416-4.033-1.416-.546-1.387-1.333-1.756-1.333-1.756-1.089-.745.083-.729.083-.729 1.205.084 1.839 1.237 1.839 1.237 1.07 1.834 2.807 1.304 3.492.997.107-.775.418-1.305.762-1.604-2.665-.305-5.467-1.334-5.467-5.931 0-1.311.469-2.381 1.236-3.221-.124-.303-.535-1.524.117-3.176 0 0 1.008-.322 3.301 1.23.957-.266 1.983-.399 3.003-.404 1.02.005 2.047.138 3.006.404 2.291-1.552 3.297-1.23 3.297-1.23.653 1.653.242 2.874.118 3.176.77.84 1.235 1.911 1.235 3.221 0 4.609-2.807 5.624-5.479 5.921.43.372.823 1.102.823 2.222v3.293c0 .319.192.694.801.576 4.765-1.589 8.199-6.086 8.199-11.386 0-6.627-5.373-12-12-12z\"/>" + \
+    "</svg>"
+
+
+# Styles of the GitHub-styled buttons, to inject once per page
+GITHUB_BUTTON_CSS = "<style>" + \
+    ".github-button {" + \
+    "    display: inline-flex;" + \
+    "    align-items: center;" + \
+    "    background-color: #24292e;" + \
+    "    color: white;" + \
+    "    padding: 8px 12px;" + \
+    "    border-radius: 6px;" + \
+    "    font-weight: 600;" + \
+    "    font-size: 14px;" + \
+    "    text-decoration: none;" + \
+    "    margin: 5px 0;" + \
+    "    transition: background-color 0.3s;" + \
+    "}" + \
+    ".github-button:hover {" + \
+    "    background-color: #0366d6;" + \
+    "}" + \
+    "</style>"
+
+
+# Function to generate GitHub-styled buttons (styled by GITHUB_BUTTON_CSS)
+def github_button(url, text):
+    return f"<a href=\"{url}\" target=\"_blank\" class=\"github-button\">" + \
+    f"{github_logo} <span style=\"margin-left: 8px;\">{text}</span>" + \
+    "</a>"
+
+
+def card_page(projects_df, page, per_page=CARDS_PER_PAGE):
+    """Projects shown on one page (1-based), sorted by category when available."""
+    if 'Category' in projects_df.columns:
+        projects_df = projects_df.sort_values(by='Category', kind='stable')
+    return projects_df.iloc[(page - 1) * per_page:page * per_page]
+
+
+def _value(row, col):
+    """Cell value of a row, or None when missing."""
+    value = row.get(col)
+    return None if value is None or pd.isna(value) else value
+
+
+def _list_html(title, text):
+    items = [line.strip() for line in str(text).split('\n') if line.strip()]
+    if not items:
+        return ""
+    return f"<h5>{title}</h5><ul>" + "".join(f"<li>{escape(item)}</li>" for item in items) + "</ul>"
+
+
+def _progress_html(progress):
+    try:
+        percent = float(str(progress).replace('%', ''))
+    except ValueError:
+        return ""
+    percent = min(max(percent, 0), 100)
+    return (
+        "<div style='background-color: #e9ecef; border-radius: 4px; height: 8px; margin: 10px 0;'>" +
+        f"<div style='background-color: #4e73df; width: {percent:g}%; height: 8px; border-radius: 4px;'></div>" +
+        "</div>" +
+        f"<p><strong>Progress:</strong> {escape(str(progress))}</p>"
+    )
+
+
+def _stat(repo_stats, name):
+    value = (repo_stats or {}).get(name)
+    return 'N/A' if value is None else f"{value:,}"
+
+
+def card_html(row, technologies=None, repo_url=None, show_github_stats=False, repo_stats=None):
+    """Render the full card of one project as an HTML string.
+
+    `technologies` is the canonical, comma-separated tech list of the project,
+    `repo_url` its linked GitHub repository, if any, and `repo_stats` the
+    cached stats of that repository (see github_client.GitHubMetadataFetcher).
+    """
+    project_name = _value(row, 'Project Name') or 'Unknown Project'
+    project_status = str(_value(row, 'Status') or 'Unknown')
+    status_class = f"status-{project_status.lower().replace(' ', '-')}"
+
+    # Left column: category, tech stack, location and GitHub link
+    left = ""
+    if _value(row, 'Category') is not None:
+        left += f"<p><strong>Category:</strong> {escape(str(row['Category']))}</p>"
+    if technologies:
+        left += f"<p><strong>Tech Stack:</strong><br>{escape(technologies)}</p>"
+    if _value(row, 'Location') is not None:
+        left += f"<p><strong>Location:</strong> {escape(str(row['Location']))}</p>"
+    if repo_url:
+        left += "<div style=\"margin-top: 15px; margin-bottom: 15px;\">" + \
+            github_button(escape(repo_url, quote=True), 'View on GitHub') + "</div>"
+        # Stats of the linked repository, from the metadata cache
+        if show_github_stats:
+            left += "<div style=\"background-color: #f6f8fa; padding: 10px; border-radius: 6px; margin-top: 10px;\">" + \
+                "<div style=\"display: flex; gap: 15px;\">" + \
+                f"<div><strong>Stars:</strong> {_stat(repo_stats, 'stars')}</div>" + \
+                f"<div><strong>Forks:</strong> {_stat(repo_stats, 'forks')}</div>" + \
+                f"<div><strong>Open Issues:</strong> {_stat(repo_stats, 'open_issues')}</div>" + \
+                "</div>" + \
+                "</div>"
+
+    # Right column: priority, progress, next actions, dependencies, documentation
+    right = ""
+    if _value(row, 'Priority') is not None:
+        priority = str(row['Priority'])
+        priority_class = f"priority-{priority.lower().replace(' ', '-')}"
+        right += f"<div style='margin-bottom: 15px;'><strong>Priority:</strong> <span class='{priority_class}'>{escape(priority)}</span></div>"
+    if _value(row, 'Progress') is not None:
+        right += _progress_html(row['Progress'])
+    if _value(row, 'Next Actions') is not None:
+        right += _list_html("Next Actions", row['Next Actions'])
+    if _value(row, 'Dependencies') is not None:
+        right += _list_html("Dependencies", row['Dependencies'])
+    if _value(row, 'Documentation Status') is not None:
+        right += f"<p><strong>Documentation Status:</strong> {escape(str(row['Documentation Status']))}</p>"
+
+    return (
+        "<div class='project-card'>" +
+        f"<h3>{escape(str(project_name))} <span class='{status_class}'>{escape(project_status)}</span></h3>" +
+        "<div style='display: flex; flex-wrap: wrap; gap: 20px;'>" +
+        f"<div style='flex: 1; min-width: 250px;'>{left}</div>" +
+        f"<div style='flex: 1; min-width: 250px;'>{right}</div>" +
+        "</div>" +
+        "</div>"
+    )
+
+
+def cards_html(projects_df, project_technologies, github_repos, show_github_stats=False, repo_stats=None):
+    """Render the cards of several projects as one HTML block.
+
+    `project_technologies` maps row positions to canonical tech lists (the
+    projects frame has a RangeIndex, so index labels are positions), and
+    `repo_stats` maps repository URLs to their stats. Cards are served from
+    the fragment cache when the row, its GitHub link and stats are unchanged.
+    """
+    repo_stats = repo_stats or {}
+    fragments = []
+    records = projects_df.to_dict('records')
+    for idx, row_hash, row in zip(projects_df.index, dashboard_aggregates.row_hashes(projects_df), records):
+        repo_url = github_repos.get(row.get('Project Name'))
+        technologies = project_technologies.get(idx)
+        stats = repo_stats.get(repo_url) if show_github_stats else None
+        key = (int(row_hash), repo_url, technologies, show_github_stats,
+               tuple(sorted(stats.items())) if stats else None)
+        with _fragment_lock:
+            fragment = _fragment_cache.get(key)
+        if fragment is None:
+            fragment = card_html(row, technologies, repo_url, show_github_stats, stats)
+            with _fragment_lock:
+                _fragment_cache[key] = fragment
+        fragments.append(fragment)
+    return "".join(fragments)
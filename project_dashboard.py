@@ -1,89 +1,27 @@
 import streamlit as st
 import pandas as pd
-import os
+import numpy as np
 import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
 import re
-import time
 from streamlit.components.v1 import html
-import base64
-from fpdf import FPDF
-import io
 import threading
 import webbrowser
-import json
-import requests
-from pathlib import Path
-# Define GitHub logo as SVG
-github_logo = "<svg xmlns=\"http://www.w3.org/2000/svg\" width=\"24\" height=\"24\" viewBox=\"0 0 24 24\" fill=\"#24292e\">" + \
-    "<path d=\"M12 0c-6.626 0-12 5.373-12 12 0 5.302 3.438 9.8 8.207 11.387.599.111.793-.261.793-.577v-2.234c-3.338.726-4.033-1.416-4.033-1.416-.546-1.387-1.333-1.756-1.333-1.756-1.089-.745.083-.729.083-.729 1.205.084 1.839 1.237 1.839 1.237 1.07 1.834 2.807 1.304 3.492.997.107-.775.418-1.305.762-1.604-2.665-.305-5.467-1.334-5.467-5.931 0-1.311.469-2.381 1.236-3.221-.124-.303-.535-1.524.117-3.176 0 0 1.008-.322 3.301 1.23.957-.266 1.983-.399 3.003-.404 1.02.005 2.047.138 3.006.404 2.291-1.552 3.297-1.23 3.297-1.23.653 1.653.242 2.874.118 3.176.77.84 1.235 1.911 1.235 3.221 0 4.609-2.807 5.624-5.479 5.921.43.372.823 1.102.823 2.222v3.293c0 .319.192.694.801.576 4.765-1.589 8.199-6.086 8.199-11.386 0-6.627-5.373-12-12-12z\"/>" + \
-    "</svg>"
-
-# Function to generate GitHub-styled buttons
-def github_button(url, text):
-    button_style = "<style>" + \
-    ".github-button {" + \
-    "    display: inline-flex;" + \
-    "    align-items: center;" + \
-    "    background-color: #24292e;" + \
-    "    color: white;" + \
-    "    padding: 8px 12px;" + \
-    "    border-radius: 6px;" + \
-    "    font-weight: 600;" + \
-    "    font-size: 14px;" + \
-    "    text-decoration: none;" + \
-    "    margin: 5px 0;" + \
-    "    transition: background-color 0.3s;" + \
-    "}" + \
-    ".github-button:hover {" + \
-    "    background-color: #0366d6;" + \
-    "}" + \
-    "</style>"
-    
-    return f"{button_style}" + \
-    f"<a href=\"{url}\" target=\"_blank\" class=\"github-button\">" + \
-    f"{github_logo} <span style=\"margin-left: 8px;\">{text}</span>" + \
-    "</a>"
-
-# Functions to load and save GitHub repository links
-def get_github_repos_file():
-    return Path("github_repos.json")
-
-def load_github_repos():
-    repos_file = get_github_repos_file()
-    if repos_file.exists():
-        try:
-            with open(repos_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            st.error(f"Error loading GitHub repository links: {e}")
-            return {}
-    return {}
-
-def save_github_repos(repos_dict):
-    repos_file = get_github_repos_file()
-    try:
-        with open(repos_file, 'w') as f:
-            json.dump(repos_dict, f)
-        return True
-    except Exception as e:
-        st.error(f"Error saving GitHub repository links: {e}")
-        return False
-
-# Function to validate GitHub repository URL
-def is_valid_github_url(url):
-    if not url:
-        return False
-    # Check if URL has valid GitHub format
-    if not url.startswith("https://github.com/"):
-        return False
-    # Check if repository exists (optional)
-    try:
-        response = requests.head(url, timeout=2)
-        return response.status_code < 400
-    except:
-        return True  # If can't connect, still accept the URL
+import sqlite3
+import project_data
+import data_sources
+import dashboard_aggregates
+import tech_detection
+import project_timeline
+import project_search
+import project_cards
+import github_client
+import github_links
+import report_export
+import project_notifications
+import cycling_routes
+import route_analytics
+from project_cards import github_logo, github_button
 
 # Page configuration
 st.set_page_config(
@@ -244,31 +182,81 @@ st.markdown(
     unsafe_allow_html=True
 )
 
+# GitHub button styles, shared by every button on the page
+st.markdown(project_cards.GITHUB_BUTTON_CSS, unsafe_allow_html=True)
+
+# Registry of data files, shared by all sessions and kept fresh by a watchdog observer
+@st.cache_resource
+def get_data_sources():
+    registry = data_sources.DataSourceRegistry()
+    registry.start_watching()
+    return registry
+
+# Project -> GitHub repository links, shared by all sessions
+@st.cache_resource
+def get_github_links():
+    return github_links.GitHubLinkStore()
+
+# GitHub URL validator (pooled session, TTL cache, background checks), shared by all sessions
+@st.cache_resource
+def get_github_validator():
+    return github_client.GitHubURLValidator()
+
+# Repository stats of the linked projects, cached on disk and refreshed in the background
+@st.cache_resource
+def get_github_metadata():
+    return github_client.GitHubMetadataFetcher()
+
+# PDF reports, built in the background and kept as files, shared by all sessions
+@st.cache_resource
+def get_report_exporter():
+    return report_export.ReportExporter()
+
+# Raised and acknowledged notifications, shared by all sessions
+@st.cache_resource
+def get_notification_store():
+    return project_notifications.NotificationStore()
+
+# Notification feed, computed once per data version and day
+@st.cache_data(max_entries=2)
+def load_notifications(data_key, day, _df):
+    return project_notifications.build_notifications(_df, day)
+
+# Timeline figures per window, shared by all sessions (see project_timeline.py)
+@st.cache_resource
+def get_timeline_cache():
+    return project_timeline.TimelineWindowCache()
+
+# Inverted search index, built once per data version (the frame itself is not hashed)
+@st.cache_resource(max_entries=2)
+def get_search_index(_df, data_key):
+    return project_search.SearchIndex(_df)
+
+# Bitmap filter index, built once per data version
+@st.cache_resource(max_entries=2)
+def get_filter_index(_df, _tech_table, data_key):
+    return project_search.FilterIndex(_df, _tech_table)
+
 # Load data from CSV files
-@st.cache_data(ttl=300)  # Cache data for 5 minutes
-def load_data():
+# Cached per data version: the watchdog observer bumps the version when the file changes
+@st.cache_data(max_entries=2)
+def load_data(data_version):
     try:
-        csv_files = []
-        for root, _, files in os.walk('.'):
-            for file in files:
-                if file.endswith('.csv'):
-                    csv_files.append(os.path.join(root, file))
+        registry = get_data_sources()
+        csv_files = registry.candidates()
         
         # If no CSV files found, return empty DataFrame
         if not csv_files:
-            st.warning("No CSV files found in the directory.")
+            st.warning(f"No CSV files found. Expected \"{registry.data_file}\" (set DASHBOARD_DATA_FILE to change it).")
             return pd.DataFrame()
         
-        # Focus on Projects - full.csv if it exists
-        main_file = None
-        for file in csv_files:
-            if "Projects - full.csv" in file:
-                main_file = file
-                break
+        # Focus on the configured main file (Projects - full.csv) if it exists
+        main_file = registry.data_file if registry.data_file in csv_files else None
         
         if main_file:
             try:
-                df = pd.read_csv(main_file)
+                # Read through the typed columnar mirror (rebuilt only when the CSV changes)
+                df = project_data.load_projects(main_file)
                 return df
             except Exception as e:
                 st.warning(f"Error reading {main_file}: {e}")
@@ -279,7 +267,7 @@ def load_data():
             if file == main_file:
                 continue  # Skip the main file if we already tried it
             try:
-                df = pd.read_csv(file)
+                df = project_data.load_projects(file)
                 if 'Project Name' in df.columns:
                     return df
             except Exception as e:
@@ -293,15 +281,31 @@ def load_data():
         st.error(f"Error loading data: {e}")
         return pd.DataFrame()
 
+# Rerun the app once the PDF report of `export_key` is ready, run as a timed fragment
+def wait_for_report(export_key):
+    report = get_report_exporter().get(export_key)
+    if report is None or report.done():
+        st.rerun()
+    st.info("Generating PDF...")
+
+# Auto-refresh check, run as a timed fragment
+def watch_data_version(rendered_version):
+    """Rerun the whole app only if the data version changed since it was rendered."""
+    if get_data_sources().version != rendered_version:
+        st.rerun()
+    st.caption(f"Data checked at {datetime.now().strftime('%H:%M:%S')} - no changes")
+
 # Function for main application
 def main():
     # Load data from CSV and merge duplicate projects
-    df = load_data()
-    df = merge_duplicate_projects(df)
+    data_version = get_data_sources().version
+    df = load_merged_data(data_version)
+    data_key = get_data_fingerprint(data_version)
+    tech_table = load_technology_table(data_version)
     show_requirements_message()
     
-    # Check if data is available
-    check_data_availability(df)
+    # Check if data is available; returns the filtered projects and their filter set
+    filtered_df, filter_key = check_data_availability(df, tech_table, data_key)
     
     # Display about section in sidebar
     st.sidebar.markdown("---")
@@ -354,53 +358,29 @@ def main():
     
     if auto_refresh:
         st.sidebar.info(f"Dashboard will refresh every {refresh_interval} seconds.")
-        time.sleep(refresh_interval)
-        st.rerun()
+        # Polled by the browser: no server thread waits between checks
+        with st.sidebar:
+            st.fragment(watch_data_version, run_every=refresh_interval)(data_version)
 
-    # Export to PDF functionality
+    # Export to PDF functionality: built in the background once per data version and filter set
     st.sidebar.markdown("---")
+    exporter = get_report_exporter()
+    export_key = (data_key, filter_key)
+    report = exporter.get(export_key)
     if st.sidebar.button("Export Dashboard to PDF"):
-        try:
-            # Create a PDF
-            pdf = FPDF()
-            pdf.add_page()
-            pdf.set_font("Arial", "B", 16)
-            pdf.cell(190, 10, "Project Management Dashboard", ln=True, align="C")
-            pdf.set_font("Arial", "", 12)
-            pdf.cell(190, 10, f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True, align="C")
-            pdf.ln(10)
-            
-            # Add dashboard metrics
-            pdf.set_font("Arial", "B", 14)
-            pdf.cell(190, 10, "Dashboard Metrics", ln=True)
-            pdf.set_font("Arial", "", 12)
-            
-            # Create a table of project data
-            pdf.set_font("Arial", "B", 12)
-            pdf.cell(60, 10, "Project Name", border=1)
-            pdf.cell(40, 10, "Status", border=1)
-            pdf.cell(40, 10, "Category", border=1)
-            pdf.cell(40, 10, "Priority", border=1, ln=True)
-            
-            pdf.set_font("Arial", "", 10)
-            for _, row in df.iterrows():
-                pdf.cell(60, 10, str(row.get('Project Name', 'Unknown'))[:28], border=1)
-                pdf.cell(40, 10, str(row.get('Status', 'Unknown')), border=1)
-                pdf.cell(40, 10, str(row.get('Category', 'Unknown')), border=1)
-                pdf.cell(40, 10, str(row.get('Priority', 'Unknown')), border=1, ln=True)
-                
-            # Output the PDF to bytes buffer
-            pdf_output = io.BytesIO()
-            pdf.output(pdf_output)
-            pdf_bytes = pdf_output.getvalue()
-            
-            # Create download button
-            b64_pdf = base64.b64encode(pdf_bytes).decode()
-            href = f'<a href="data:application/pdf;base64,{b64_pdf}" download="project_dashboard.pdf">Download PDF</a>'
-            st.sidebar.markdown(href, unsafe_allow_html=True)
-            st.sidebar.success("PDF Export Ready! Click the link above to download.")
-        except Exception as e:
-            st.sidebar.error(f"Error generating PDF: {e}")
+        report = exporter.submit(export_key, filtered_df)
+    if report is not None:
+        if not report.done():
+            with st.sidebar:
+                st.fragment(wait_for_report, run_every=1)(export_key)
+        elif report.exception() is not None:
+            st.sidebar.error(f"Error generating PDF: {report.exception()}")
+        else:
+            # The file lives as long as `report` is held, even if the exporter drops it meanwhile
+            with open(report.result(), 'rb') as pdf_file:
+                st.sidebar.download_button("Download PDF", pdf_file, file_name="project_dashboard.pdf",
+                                           mime="application/pdf")
+            st.sidebar.success("PDF Export Ready! Click the button above to download.")
     
     # Title and description
     st.title("Project Management Dashboard")
@@ -411,53 +391,44 @@ def main():
         "> Other CSV files are optional and may be excluded from version control."
     )
     
+    # Alerts for stale and high-priority projects, with their unread state
+    display_notifications(df, data_key)
+    
 
 
-@st.cache_data
-def merge_duplicate_projects(df):
-    # Identifie les doublons basés sur le nom du projet
-    duplicates = df['Project Name'].duplicated(keep=False)
-    unique_df = df[~duplicates].copy()
-    
-    # Traite les projets en doublon
-    duplicate_names = df.loc[duplicates, 'Project Name'].unique()
-    
-    for name in duplicate_names:
-        # Sélectionne toutes les occurrences de ce projet
-        project_rows = df[df['Project Name'] == name]
-        
-        # Crée une nouvelle ligne en fusionnant les informations
-        merged_row = project_rows.iloc[0].copy()
-        
-        # Pour chaque colonne, prend la valeur non vide la plus détaillée
-        for col in df.columns:
-            if col != 'Project Name' and col != 'Unnamed: 0':
-                # Valeurs uniques non-vides pour cette colonne
-                values = [val for val in project_rows[col].unique() if pd.notna(val) and val != '']
-                
-                if len(values) > 0:
-                    # S'il y a plusieurs valeurs, prendre la plus longue (probablement la plus détaillée)
-                    merged_row[col] = max(values, key=lambda x: len(str(x)) if isinstance(x, str) else 0)
-        
-        # Ajouter cette ligne fusionnée aux résultats
-        unique_df = pd.concat([unique_df, pd.DataFrame([merged_row])], ignore_index=True)
-    
-    return unique_df
+# Merged frame, cached on the data version rather than on a hash of the whole frame
+@st.cache_data(max_entries=2)
+def load_merged_data(data_version):
+    # Fusionne les doublons en une seule passe groupby (voir project_data.py)
+    return project_data.merge_duplicate_projects(load_data(data_version))
+
+# Normalized project/technology table, built once per data version
+@st.cache_data(max_entries=2)
+def load_technology_table(data_version):
+    return project_data.build_technology_table(load_merged_data(data_version))
+
+# Content hash of the merged frame, computed once per data version
+@st.cache_data(max_entries=2)
+def get_data_fingerprint(data_version):
+    return dashboard_aggregates.frame_fingerprint(load_merged_data(data_version))
 
 # If DataFrame is empty, show message and stop
-def check_data_availability(df):
+def check_data_availability(df, tech_table, data_key):
     if df.empty:
         st.warning("No data available. Please check your CSV files.")
         st.stop()
     
+    # Overview and chart aggregates, computed once per data version (keyed by content hash)
+    aggregates = dashboard_aggregates.get_aggregates(df, tech_table, data_key)
+    
     # Overview metrics section
     st.markdown("<div class='section-header'><h2>Overview</h2></div>", unsafe_allow_html=True)
     
     # Count metrics
-    total_projects = len(df)
-    active_projects = len(df[df['Status'] == 'Active']) if 'Status' in df.columns else 0
-    high_priority = len(df[df['Priority'] == 'High']) if 'Priority' in df.columns else 0
-    unique_categories = df['Category'].nunique() if 'Category' in df.columns else 0
+    total_projects = aggregates['total_projects']
+    active_projects = aggregates['active_projects']
+    high_priority = aggregates['high_priority']
+    unique_categories = aggregates['unique_categories']
     
     # Create metrics row
     col1, col2, col3, col4 = st.columns(4)
@@ -505,9 +476,8 @@ def check_data_availability(df):
     chart_col1, chart_col2 = st.columns(2)
     
     with chart_col1:
-        if 'Status' in df.columns:
-            status_counts = df['Status'].value_counts().reset_index()
-            status_counts.columns = ['Status', 'Count']
+        if aggregates['status_counts'] is not None:
+            status_counts = aggregates['status_counts']
             
             fig = px.pie(status_counts, values='Count', names='Status', 
                         title='Project Distribution by Status',
@@ -522,9 +492,8 @@ def check_data_availability(df):
             st.warning("Status column not found in the data.")
     
     with chart_col2:
-        if 'Category' in df.columns:
-            category_counts = df['Category'].value_counts().reset_index()
-            category_counts.columns = ['Category', 'Count']
+        if aggregates['category_counts'] is not None:
+            category_counts = aggregates['category_counts']
             
             fig = px.bar(category_counts, x='Category', y='Count',
                         title='Project Distribution by Category',
@@ -539,203 +508,9 @@ def check_data_availability(df):
             st.warning("Category column not found in the data.")
     
     # Technology usage chart
-    # Function to detect technologies from project names and descriptions
-    def detect_technologies(project_name, description=None, category=None):
-        # Dictionary mapping keywords to technologies
-        tech_keywords = {
-            # Frontend frameworks and libraries
-            'react': 'React',
-            'vue': 'Vue.js',
-            'angular': 'Angular',
-            'svelte': 'Svelte',
-            'jquery': 'jQuery',
-            'backbone': 'Backbone.js',
-            'ember': 'Ember.js',
-            
-            # Backend frameworks
-            'node': 'Node.js',
-            'express': 'Express.js',
-            'django': 'Django',
-            'flask': 'Flask',
-            'fastapi': 'FastAPI',
-            'rails': 'Ruby on Rails',
-            'symfony': 'Symfony',
-            'laravel': 'Laravel',
-            'spring': 'Spring',
-            'nestjs': 'NestJS',
-            'asp.net': 'ASP.NET',
-            
-            # Languages
-            'php': 'PHP',
-            'python': 'Python',
-            'java': 'Java',
-            'javascript': 'JavaScript',
-            'typescript': 'TypeScript',
-            'go': 'Go',
-            'golang': 'Go',
-            'rust': 'Rust',
-            'c#': 'C#',
-            '.net': '.NET',
-            'ruby': 'Ruby',
-            'scala': 'Scala',
-            'elixir': 'Elixir',
-            'clojure': 'Clojure',
-            'haskell': 'Haskell',
-            
-            # Frontend technologies
-            'html': 'HTML',
-            'css': 'CSS',
-            'sass': 'Sass',
-            'less': 'Less',
-            'bootstrap': 'Bootstrap',
-            'tailwind': 'Tailwind CSS',
-            'material': 'Material UI',
-            'bulma': 'Bulma',
-            
-            # Databases
-            'mongo': 'MongoDB',
-            'postgres': 'PostgreSQL',
-            'mysql': 'MySQL',
-            'sql': 'SQL',
-            'redis': 'Redis',
-            'sqlite': 'SQLite',
-            'firestore': 'Firestore',
-            'dynamodb': 'DynamoDB',
-            'cassandra': 'Cassandra',
-            'couchdb': 'CouchDB',
-            
-            # Infrastructure
-            'docker': 'Docker',
-            'kubernetes': 'Kubernetes',
-            'k8s': 'Kubernetes',
-            'aws': 'AWS',
-            'azure': 'Azure',
-            'gcp': 'GCP',
-            'heroku': 'Heroku',
-            'netlify': 'Netlify',
-            'vercel': 'Vercel',
-            'jenkins': 'Jenkins',
-            'gitlab': 'GitLab CI',
-            'github actions': 'GitHub Actions',
-            
-            # Mobile
-            'android': 'Android',
-            'ios': 'iOS',
-            'swift': 'Swift',
-            'kotlin': 'Kotlin',
-            'flutter': 'Flutter',
-            'react native': 'React Native',
-            'expo': 'Expo',
-            'ionic': 'Ionic',
-            'xamarin': 'Xamarin',
-            
-            # AI/ML
-            'tensorflow': 'TensorFlow',
-            'pytorch': 'PyTorch',
-            'keras': 'Keras',
-            'scikit': 'Scikit-learn',
-            'ml': 'Machine Learning',
-            'ai': 'AI',
-            'cv': 'Computer Vision',
-            'nlp': 'NLP',
-            
-            # Blockchain
-            'blockchain': 'Blockchain',
-            'web3': 'Web3',
-            'eth': 'Ethereum',
-            'solidity': 'Solidity',
-            'nft': 'NFT',
-            'bitcoin': 'Bitcoin',
-            
-            # CMS
-            'wordpress': 'WordPress',
-            'drupal': 'Drupal',
-            'joomla': 'Joomla',
-            'contentful': 'Contentful',
-            'strapi': 'Strapi',
-            
-            # Testing
-            'jest': 'Jest',
-            'cypress': 'Cypress',
-            'selenium': 'Selenium',
-            'playwright': 'Playwright',
-            'pytest': 'Pytest',
-            'junit': 'JUnit',
-            'solidity': 'Solidity',
-            'nft': 'NFT',
-            'fastapi': 'FastAPI',
-            'api': 'API',
-            'graphql': 'GraphQL',
-            'rest': 'REST API',
-            'sass': 'SASS',
-            'gatsby': 'Gatsby',
-            'next': 'Next.js',
-            'nuxt': 'Nuxt.js',
-            'svelte': 'Svelte',
-            'firebase': 'Firebase',
-            'supabase': 'Supabase',
-            'stripe': 'Stripe',
-            'pwa': 'PWA',
-            'seo': 'SEO',
-            'ui': 'UI/UX',
-            'ux': 'UI/UX',
-            'design': 'Design',
-            'figma': 'Figma',
-            'websocket': 'WebSockets',
-            'socketio': 'Socket.IO',
-            'shadcn': 'shadcn/ui',
-        }
-        
-        detected_techs = set()
-        
-        # Helper function to detect tech from text
-        def detect_from_text(text):
-            if not text or pd.isna(text):
-                return
-            
-            text_lower = text.lower()
-            for keyword, tech in tech_keywords.items():
-                if keyword in text_lower:
-                    detected_techs.add(tech)
-        
-        # Check project name
-        detect_from_text(project_name)
-        
-        # Check description
-        detect_from_text(description)
-        
-        # Use category to infer technologies
-        category_tech_map = {
-            'Web Development': ['HTML', 'CSS', 'JavaScript'],
-            'Mobile Development': ['Mobile'],
-            'Database': ['Database'],
-            'Machine Learning': ['Python', 'Machine Learning'],
-            'AI/ML': ['Python', 'AI', 'Machine Learning'],
-            'Data Science': ['Python', 'Data Analysis'],
-            'DevOps': ['Docker', 'CI/CD'],
-            'Blockchain': ['Blockchain', 'Smart Contracts'],
-        }
-        
-        if category and category in category_tech_map:
-            detected_techs.update(category_tech_map[category])
-        
-        # Return comma-separated string of technologies
-        return ', '.join(detected_techs) if detected_techs else None
-
-    # Technology usage chart
-    if 'Tech Stack' in df.columns:
-        # Extract technologies from Tech Stack column
-        tech_list = []
-        for tech_stack in df['Tech Stack'].dropna():
-            techs = [t.strip() for t in tech_stack.split(',')]
-            # Replace 'Inconnu' with original value instead of filtering it out
-            # This ensures we don't replace it with "Multiple Technologies" elsewhere
-            processed_techs = [tech if tech != 'Inconnu' else 'Unknown' for tech in techs]
-            tech_list.extend(processed_techs)
-        
-        tech_counts = pd.Series(tech_list).value_counts().reset_index()
-        tech_counts.columns = ['Technology', 'Count']  # Add this line to rename columns
-        tech_counts = tech_counts.head(15)  # Top 15 technologies
+    if aggregates['tech_counts'] is not None:
+        # Canonical technologies from the normalized technology table ('Inconnu' shown as 'Unknown')
+        tech_counts = aggregates['tech_counts'].head(15)  # Top 15 technologies
         
         fig = px.bar(tech_counts, x='Count', y='Technology', 
                     title='Most Used Technologies',
@@ -760,51 +535,39 @@ def check_data_availability(df):
             
         with col2:
             if st.button("Auto-detect Technologies", key="auto_detect_tech"):
-                # Make a copy of the DataFrame to work with
-                updated_df = df.copy()
-                # Count how many tech stacks were updated
-                update_count = 0
+                # Detect technologies for all projects with unknown stacks in one batch;
+                # the proposal is kept in the session so the save button survives the rerun
+                st.session_state['detected_tech_changes'] = (data_key, tech_detection.propose_tech_stacks(df))
+        
+        # Proposed changes for the current data version, if any
+        proposal_key, tech_changes = st.session_state.get('detected_tech_changes', (None, None))
+        if tech_changes is not None and proposal_key == data_key:
+            update_count = len(tech_changes)
+            
+            # If any updates were made, offer to save the changes
+            if update_count > 0:
+                st.success(f"✅ Successfully detected technologies for {update_count} projects!")
+                st.dataframe(tech_changes, use_container_width=True, hide_index=True)
                 
-                # Find projects with unknown or empty tech stacks
-                for idx, row in updated_df.iterrows():
-                    # Check if Tech Stack is Unknown, empty, or contains 'Inconnu'
-                    if ('Tech Stack' not in row or 
-                        pd.isna(row['Tech Stack']) or 
-                        row['Tech Stack'] == 'Unknown' or 
-                        row['Tech Stack'] == 'Inconnu' or
-                        row['Tech Stack'] == 'Multiple Technologies' or
-                        row['Tech Stack'] == ''):
+                if st.button("Save Changes to CSV", key="save_detected_tech"):
+                    try:
+                        data_file = get_data_sources().data_file
                         
-                        # Try to detect technologies
-                        project_name = row.get('Project Name', '')
-                        description = row.get('Résumé_Détaillé', '')
-                        category = row.get('Category', '')
+                        # Backup the original file
+                        backup_file = f"Projects - full_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                        project_data.save_projects(df, backup_file)
                         
-                        detected_tech = detect_technologies(project_name, description, category)
+                        # Save the updated DataFrame
+                        updated_df = tech_detection.apply_tech_stack_changes(df, tech_changes)
+                        project_data.save_projects(updated_df, data_file)
+                        del st.session_state['detected_tech_changes']
                         
-                        if detected_tech:
-                            updated_df.at[idx, 'Tech Stack'] = detected_tech
-                            update_count += 1
-                
-                # If any updates were made, offer to save the changes
-                if update_count > 0:
-                    st.success(f"✅ Successfully detected technologies for {update_count} projects!")
-                    
-                    if st.button("Save Changes to CSV", key="save_detected_tech"):
-                        try:
-                            # Backup the original file
-                            backup_file = f"Projects - full_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                            df.to_csv(backup_file, index=False)
-                            
-                            # Save the updated DataFrame
-                            updated_df.to_csv('Projects - full.csv', index=False)
-                            
-                            st.success(f"✅ Changes saved! Original file backed up as {backup_file}")
-                            st.info("Refresh the page to see the updated technology information.")
-                        except Exception as e:
-                            st.error(f"❌ Error saving changes: {e}")
-                else:
-                    st.info("No new technologies detected. All projects already have appropriate tech stacks.")
+                        st.success(f"✅ Changes saved! Original file backed up as {backup_file}")
+                        st.info("The dashboard picks up the updated technology information on its next refresh.")
+                    except Exception as e:
+                        st.error(f"❌ Error saving changes: {e}")
+            else:
+                st.info("No new technologies detected. All projects already have appropriate tech stacks.")
                     
         st.markdown("---")
         fig.update_layout(height=500)
@@ -858,192 +621,36 @@ def check_data_availability(df):
     # Create timeline data
     if 'Last Updated' in df.columns:
         try:
-            # Create a copy of dataframe for timeline
-            timeline_df = df.copy()
-            
-            # Apply filters
-            if status_timeline_filter:
-                timeline_df = timeline_df[timeline_df['Status'].isin(status_timeline_filter)]
-            
-            if category_timeline_filter and 'Category' in df.columns:
-                timeline_df = timeline_df[timeline_df['Category'].isin(category_timeline_filter)]
-            
-            if priority_timeline_filter and 'Priority' in df.columns:
-                timeline_df = timeline_df[timeline_df['Priority'].isin(priority_timeline_filter)]
-            
-            # Prepare timeline data
-            if 'Creation Date' in timeline_df.columns:
-                timeline_df['Start'] = pd.to_datetime(timeline_df['Creation Date'], errors='coerce')
-            else:
-                # If no creation date, use a date 30 days before Last Updated
-                timeline_df['Start'] = pd.to_datetime(timeline_df['Last Updated'], errors='coerce') - pd.Timedelta(days=30)
-            
-            timeline_df['End'] = pd.to_datetime(timeline_df['Last Updated'], errors='coerce')
+            # Apply filters and compute Start/End/Target dates (see project_timeline.py)
+            timeline_df = project_timeline.prepare_timeline_data(
+                df, status_timeline_filter, category_timeline_filter, priority_timeline_filter)
             
-            # Add target completion date as a milestone
-            if 'Target Completion' in timeline_df.columns:
-                timeline_df['Target'] = pd.to_datetime(timeline_df['Target Completion'], errors='coerce')
-            
-            # Remove rows with invalid dates
-            timeline_df = timeline_df.dropna(subset=['Start', 'End'])
-            
-            # Sort by start date
-            timeline_df = timeline_df.sort_values('Start')
-            
-            # Limit to the most recent 100 projects to keep the chart readable
-            if len(timeline_df) > 100:
-                st.info(f"Showing the 100 most recent projects out of {len(timeline_df)} matching your filters.")
-                timeline_df = timeline_df.iloc[-100:]
+            # Optional date range: only projects overlapping it are shown
+            date_range = None
+            if not timeline_df.empty:
+                min_date = timeline_df['Start'].min().date()
+                max_date = timeline_df['End'].max().date()
+                if min_date < max_date:
+                    date_range = st.slider("Timeline date range", min_value=min_date, max_value=max_date,
+                                           value=(min_date, max_date), format="YYYY-MM-DD")
+                    timeline_df = project_timeline.slice_by_dates(timeline_df, *date_range)
+            
+            # Browse the timeline one window of projects at a time instead of dropping older ones
+            page_size = project_timeline.TIMELINE_PAGE_SIZE
+            page_count = project_timeline.page_count(len(timeline_df), page_size)
+            page = 1
+            if page_count > 1:
+                page = st.number_input(f"Timeline page (1 = most recent, {page_count} pages)",
+                                       min_value=1, max_value=page_count, value=1, step=1)
+                last_shown = len(timeline_df) - (page - 1) * page_size
+                first_shown = max(1, last_shown - page_size + 1)
+                st.info(f"Showing projects {first_shown}-{last_shown} of {len(timeline_df)} matching your filters (sorted by start date).")
             
             if not timeline_df.empty:
-                # Create the timeline visualization using Plotly
-                fig = go.Figure()
-                
-                # Define colors for different statuses - using more vibrant colors
-                color_map = {
-                    'Active': '#00E676',      # Vibrant green
-                    'On Hold': '#FFAB00',     # Vibrant amber
-                    'Completed': '#2979FF',   # Vibrant blue
-                    'Abandoned': '#FF1744',   # Vibrant red
-                    'In Progress': '#651FFF', # Vibrant purple
-                    'Planned': '#00B0FF',     # Vibrant light blue
-                    'Testing': '#FF9100',     # Vibrant orange
-                    'Reviewing': '#F50057'    # Vibrant pink
-                }
-                
-                # Add timeline markers for each project (using go.Scatter instead of go.Bar)
-                for idx, row in timeline_df.iterrows():
-                    status = row.get('Status', 'Unknown')
-                    # Default is now a vibrant teal instead of grey if status not in map
-                    color = color_map.get(status, '#00BCD4')
-                    
-                    # Calculate duration for the hover text
-                    start_date = row['Start']
-                    end_date = row['End']
-                    duration_days = (end_date - start_date).days
-                    
-                    # Create hover text with relevant project info
-                    hover_text = (
-                        f"<b>{row['Project Name']}</b><br>"
-                        f"Status: {status}<br>"
-                        f"Duration: {duration_days} days<br>"
-                        f"Start: {start_date.strftime('%Y-%m-%d')}<br>"
-                        f"Last Update: {end_date.strftime('%Y-%m-%d')}<br>"
-                    )
-                    
-                    if 'Category' in row and pd.notna(row['Category']):
-                        hover_text += f"Category: {row['Category']}<br>"
-                        hover_text += f"Category: {row['Category']}<br>"
-                    
-                    if 'Priority' in row and pd.notna(row['Priority']):
-                        hover_text += f"Priority: {row['Priority']}<br>"
-                    
-                    if 'Tech Stack' in row and pd.notna(row['Tech Stack']):
-                        hover_text += f"Tech Stack: {row['Tech Stack']}<br>"
-                    # Add a line connecting start to end date
-                    fig.add_trace(go.Scatter(
-                        x=[start_date, end_date],
-                        y=[row['Project Name'], row['Project Name']],
-                        mode='lines',
-                        line=dict(
-                            color=color,
-                            width=3
-                        ),
-                        name=status,
-                        legendgroup=status,
-                        showlegend=(idx == next((i for i, r in timeline_df.iterrows() if r.get('Status') == status), None)),
-                        hoverinfo='skip'
-                    ))
-                    
-                    # Add start point marker (circle)
-                    fig.add_trace(go.Scatter(
-                        x=[start_date],
-                        y=[row['Project Name']],
-                        mode='markers',
-                        marker=dict(
-                            symbol='circle',
-                            size=8,
-                            color=color,
-                            line=dict(width=1, color='white')
-                        ),
-                        name=f"{status} (Start)",
-                        hoverinfo='text',
-                        hovertext=hover_text,
-                        showlegend=False,
-                        legendgroup=status
-                    ))
-                    
-                    # Add end point marker (circle)
-                    fig.add_trace(go.Scatter(
-                        x=[end_date],
-                        y=[row['Project Name']],
-                        mode='markers',
-                        marker=dict(
-                            symbol='circle',
-                            size=10,
-                            color=color,
-                            line=dict(width=1, color='white')
-                        ),
-                        name=f"{status} (End)",
-                        hoverinfo='text',
-                        hovertext=hover_text,
-                        showlegend=False,
-                        legendgroup=status
-                    ))
-                    if 'Target' in row and pd.notna(row['Target']):
-                        fig.add_trace(go.Scatter(
-                            x=[row['Target']],
-                            y=[row['Project Name']],
-                            mode='markers',
-                            marker=dict(
-                                symbol='diamond',
-                                size=10,
-                                color='rgba(255,255,255,0.9)',  # White fill
-                                line=dict(width=2, color='#E91E63'),  # Pink border
-                            ),
-                            name='Target Date',
-                            hoverinfo='text',
-                            hovertext=f"<b>Target Completion:</b> {row['Target'].strftime('%Y-%m-%d')}",
-                            showlegend=(idx == timeline_df.index[0]),  # Only show in legend once
-                            legendgroup='Target'
-                        ))
-                
-                # Update layout for better appearance
-                fig.update_layout(
-            title='Project Timeline (Gantt Chart)',
-            height=max(500, min(len(timeline_df) * 20, 1000)),  # Hauteur limitée entre 500 et 1000px
-            margin=dict(l=20, r=20, t=60, b=30),  # Marges plus grandes
-            plot_bgcolor='rgba(250, 250, 250, 0.9)',  # Fond légèrement grisé pour meilleur contraste
-            yaxis=dict(
-                autorange="reversed",  # Reverses the y-axis so newest projects are at top
-                title='',
-                tickangle=-30,  # Angle des noms de projets pour éviter le chevauchement
-                tickfont=dict(size=11),  # Smaller font for project names
-            ),
-            xaxis=dict(
-                title='Timeline',
-                gridcolor='rgba(240, 240, 240, 0.9)',  # Lighter grid lines
-                zeroline=False,  # Remove zero line for cleaner look
-            ),
-            hoverlabel=dict(
-                bgcolor="white",
-                font_size=12,
-                font_family="Arial",
-                bordercolor='rgba(0,0,0,0.1)',  # Subtle border
-            ),
-            bargap=0.4,  # Increase gap between bars for better separation
-            uniformtext=dict(minsize=8, mode='hide'),  # Consistent text size
-            showlegend=True,
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1,
-                bgcolor='rgba(255,255,255,0.8)',
-            ),
-            )  # End of layout configuration
-                # No need to manually add legend items as they're now created naturally through the scatter points
+                # One trace per status (None-separated segments); adjacent pages are built in the background
+                view_key = (data_key, tuple(map(str, status_timeline_filter)), tuple(map(str, category_timeline_filter)),
+                            tuple(map(str, priority_timeline_filter)), date_range)
+                fig = get_timeline_cache().get_figure(view_key, timeline_df, page, page_size)
                 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
                 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
                 st.plotly_chart(fig, use_container_width=True)
@@ -1065,60 +672,43 @@ def check_data_availability(df):
     # Create filter columns
     filter_col1, filter_col2, filter_col3, filter_col4 = st.columns(4)
     
+    # Per-value bitmaps of the filterable fields, built once per data version
+    filter_index = get_filter_index(df, tech_table, data_key)
+    
     # Filter by status
     with filter_col1:
-        status_options = ['All'] + sorted(df['Status'].unique().tolist()) if 'Status' in df.columns else ['All']
+        status_options = ['All'] + filter_index.values('Status')
         status_filter = st.selectbox('Filter by Status', status_options)
     
     # Filter by category
     with filter_col2:
-        # Filter out NaN values from Category column before sorting
-        if 'Category' in df.columns:
-            # Get unique categories and filter out NaN values
-            categories = [cat for cat in df['Category'].unique().tolist() if pd.notna(cat)]
-            category_options = ['All'] + sorted(categories)
-        else:
-            category_options = ['All']
+        # Missing categories never get a bitmap, so NaN is not offered
+        category_options = ['All'] + filter_index.values('Category')
         category_filter = st.selectbox('Filter by Category', category_options)
     
     # Filter by priority
     with filter_col3:
-        priority_options = ['All'] + sorted(df['Priority'].unique().tolist()) if 'Priority' in df.columns else ['All']
+        priority_options = ['All'] + filter_index.values('Priority')
         priority_filter = st.selectbox('Filter by Priority', priority_options)
     
     # Filter by technology
     with filter_col4:
-        # Extract all unique technologies
-        all_techs = set()
-        if 'Tech Stack' in df.columns:
-            for tech_stack in df['Tech Stack'].dropna():
-                techs = [t.strip() for t in tech_stack.split(',')]
-                all_techs.update(techs)
-        
-        tech_options = ['All'] + sorted(list(all_techs))
+        # Exact technologies, so 'React' no longer matches 'React Native'
+        tech_options = ['All'] + filter_index.values('Tech Stack')
         tech_filter = st.selectbox('Filter by Technology', tech_options)
     
     # Search functionality
     search_query = st.text_input('Search Projects', '')
     
-    # Apply filters
-    filtered_df = df.copy()
-    
-    if status_filter != 'All' and 'Status' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['Status'] == status_filter]
-    
-    if category_filter != 'All' and 'Category' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['Category'] == category_filter]
-    
-    if priority_filter != 'All' and 'Priority' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['Priority'] == priority_filter]
-    
-    if tech_filter != 'All' and 'Tech Stack' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['Tech Stack'].fillna('').str.contains(tech_filter)]
-    
-    if search_query:
-        # Search across all string columns
-        filtered_df = filtered_df[filtered_df.astype(str).agg(' '.join, axis=1).str.contains(search_query, case=False)]
+    # Apply filters: bitwise ANDs of the bitmaps, restricted to the search results if any
+    search_positions = get_search_index(df, data_key).search_positions(search_query) if search_query else None
+    filter_mask = filter_index.mask({
+        'Status': status_filter,
+        'Category': category_filter,
+        'Priority': priority_filter,
+        'Tech Stack': tech_filter,
+    }, search_positions)
+    filtered_df = df[filter_mask]
     
     # Display number of filtered projects
     st.markdown(f"**Showing {len(filtered_df)} of {len(df)} projects**")
@@ -1132,147 +722,97 @@ def check_data_availability(df):
     if filtered_df.empty:
         st.warning("No projects match the selected filters.")
     else:
+        github_repos = get_github_links().all()
+        
+        # Only the cards of the visible page are rendered
+        page_count = project_timeline.page_count(len(filtered_df), project_cards.CARDS_PER_PAGE)
+        card_page = 1
+        if page_count > 1:
+            card_page = st.number_input(f"Project page ({page_count} pages, {project_cards.CARDS_PER_PAGE} projects per page)",
+                                        min_value=1, max_value=page_count, value=1, step=1)
+        page_df = project_cards.card_page(filtered_df, card_page)
+        # Stats of the repositories linked on this page; the fetcher works unauthenticated
+        # and uses GITHUB_TOKEN when it is set
+        page_repos = [github_repos[name] for name in page_df.get('Project Name', []) if name in github_repos]
+        show_github_stats = bool(page_repos)
+        repo_stats = {}
+        if show_github_stats:
+            # Cards render from the cache; stale stats show up on a later rerun
+            github_metadata = get_github_metadata()
+            github_metadata.refresh_in_background(page_repos)
+            repo_stats = github_metadata.cached_stats(page_repos)
+        
         # Group projects by category
-        if 'Category' in filtered_df.columns:
-            # Sort the DataFrame by Category to group properly
-            filtered_df = filtered_df.sort_values(by='Category')
-            
-            # Get all unique categories
-            categories = filtered_df['Category'].unique()
-            
-            # Create collapsible sections for each category
-            for category in categories:
-                category_df = filtered_df[filtered_df['Category'] == category]
-                
-                # Create a collapsible section for each category
-                with st.expander(f"**{category}** ({len(category_df)} projects)", expanded=False):
-                    # Display all projects in this category
-                    for _, row in category_df.iterrows():
-                        st.markdown("<div class='project-card'>", unsafe_allow_html=True)
-                        
-                        # Project header with status badge
-                        project_name = row.get('Project Name', 'Unknown Project')
-                        project_status = row.get('Status', 'Unknown')
-                        status_class = f"status-{project_status.lower().replace(' ', '-')}"
-                        
-                        st.markdown(f"<h3>{project_name} <span class='{status_class}'>{project_status}</span></h3>", unsafe_allow_html=True)
+        if 'Category' in page_df.columns:
+            # Project counts per category over all filtered projects, not just this page
+            category_totals = filtered_df['Category'].value_counts(dropna=False)
+            
+            # Create collapsible sections for each category, each rendered in one HTML block
+            for category, category_df in page_df.groupby('Category', sort=False, dropna=False, observed=True):
+                with st.expander(f"**{category}** ({category_totals.get(category, len(category_df))} projects)", expanded=False):
+                    st.markdown(project_cards.cards_html(category_df, aggregates['project_technologies'],
+                                                         github_repos, show_github_stats, repo_stats),
+                                unsafe_allow_html=True)
         else:
-            # If no Category column, fall back to displaying all filtered projects
-            for _, row in filtered_df.iterrows():
-                st.markdown("<div class='project-card'>", unsafe_allow_html=True)
-                
-                # Project header with status badge
-                project_name = row.get('Project Name', 'Unknown Project')
-                project_status = row.get('Status', 'Unknown')
-                status_class = f"status-{project_status.lower().replace(' ', '-')}"
-                
-                st.markdown(f"<h3>{project_name} <span class='{status_class}'>{project_status}</span></h3>", unsafe_allow_html=True)
-            
-            # Project details in columns
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Display category and tech stack
-                if 'Category' in row and not pd.isna(row['Category']):
-                    st.markdown(f"**Category:** {row['Category']}")
-                
-                if 'Tech Stack' in row and not pd.isna(row['Tech Stack']):
-                    st.markdown("**Tech Stack:**")
-                    tech_list = [tech.strip() for tech in row['Tech Stack'].split(',')]
-                    st.markdown(", ".join(tech_list))
-                
-                if 'Location' in row and not pd.isna(row['Location']):
-                    st.markdown(f"**Location:** {row['Location']}")
-                
-                # Display existing GitHub repository link if available
-                if project_name in github_repos:
-                    repo_url = github_repos[project_name]
-                    # Add GitHub styled repository link
-                    st.markdown(
-                        f"<div style=\"margin-top: 15px; margin-bottom: 15px;\">" +
-                        f"{github_button(repo_url, 'View on GitHub')}" +
-                        "</div>", 
-                        unsafe_allow_html=True
-                    )
-                    
-                    # Add basic GitHub stats if connected
-                    if 'github_token' in st.session_state:
-                        st.markdown(
-                            "<div style=\"background-color: #f6f8fa; padding: 10px; border-radius: 6px; margin-top: 10px;\">" +
-                            "<div style=\"display: flex; gap: 15px;\">" +
-                            "<div><strong>Stars:</strong> N/A</div>" +
-                            "<div><strong>Forks:</strong> N/A</div>" +
-                            "<div><strong>Open Issues:</strong> N/A</div>" +
-                            "</div>" +
-                            "</div>", 
-                            unsafe_allow_html=True
-                        )
-                
-                # GitHub repository form in an expander to save space
-                with st.expander("Link GitHub Repository"):
-                    with st.form(key=f"github_form_{_}"):
-                        repo_url = st.text_input("GitHub Repository URL", 
-                                               value=github_repos.get(project_name, ""),
-                                               placeholder="https://github.com/username/repo")
-                        
-                        # Option to generate repo name from project name
-                        if st.session_state.get('default_github_org', ''):
-                            org = st.session_state['default_github_org']
-                            repo_slug = project_name.lower().replace(' ', '-')
-                            suggested_url = f"https://github.com/{org}/{repo_slug}"
-                            
-                            if st.button("Use suggested URL", key=f"suggest_{_}"):
-                                repo_url = suggested_url
-                        
-                        # Validate GitHub URL
-                        if repo_url and not repo_url.startswith("https://github.com/"):
-                            st.warning("Please enter a valid GitHub URL starting with https://github.com/")
-                        
-                        submit = st.form_submit_button("Save GitHub Link")
-                        
-                        if submit and repo_url:
-                            if is_valid_github_url(repo_url):
-                                github_repos[project_name] = repo_url
-                                if save_github_repos(github_repos):
-                                    st.success(f"GitHub repository linked to {project_name}!")
-                                else:
-                                    st.error("Failed to save GitHub repository link. Please try again.")
-                            else:
-                                st.error("Invalid GitHub URL. Please check the format and ensure the repository exists.")
-                            # Remove experimental_rerun to avoid reloading the entire page
-                            # st.experimental_rerun()
-            
-            with col2:
-                if 'Priority' in row and not pd.isna(row['Priority']):
-                    priority_class = f"priority-{row['Priority'].lower().replace(' ', '-')}"
-                    st.markdown(f"<div style='margin-bottom: 15px;'><strong>Priority:</strong> <span class='{priority_class}'>{row['Priority']}</span></div>", unsafe_allow_html=True)
+            # If no Category column, fall back to displaying all projects of the page
+            st.markdown(project_cards.cards_html(page_df, aggregates['project_technologies'],
+                                                 github_repos, show_github_stats, repo_stats),
+                        unsafe_allow_html=True)
+        
+        # A single GitHub repository form for the projects of this page
+        with st.expander("Link GitHub Repository", expanded='github_link_message' in st.session_state):
+            if 'github_link_message' in st.session_state:
+                level, message = st.session_state.pop('github_link_message')
+                getattr(st, level)(message)
+            with st.form(key="github_form"):
+                project_name = st.selectbox("Project", page_df['Project Name'].astype(str).tolist())
+                repo_url = st.text_input("GitHub Repository URL",
+                                         placeholder="https://github.com/username/repo")
                 
-                # Progress indicator if available
-                if 'Progress' in row and not pd.isna(row['Progress']):
-                    try:
-                        progress_value = float(row['Progress'].replace('%', '')) / 100
-                        st.progress(progress_value)
-                        st.markdown(f"**Progress:** {row['Progress']}")
-                    except:
-                        pass
+                # Option to generate repo name from project name
+                if st.session_state.get('default_github_org', ''):
+                    org = st.session_state['default_github_org']
+                    repo_slug = project_name.lower().replace(' ', '-')
+                    st.caption(f"Suggested URL: https://github.com/{org}/{repo_slug}")
                 
-                # Next Actions
-                if 'Next Actions' in row and not pd.isna(row['Next Actions']):
-                    st.markdown("##### Next Actions")
-                    actions = row['Next Actions'].split('\n')
-                    for action in actions:
-                        if action.strip():
-                            st.markdown(f"- {action.strip()}")
+                submit = st.form_submit_button("Save GitHub Link")
                 
-                # Dependencies
-                if 'Dependencies' in row and not pd.isna(row['Dependencies']):
-                    st.markdown("##### Dependencies")
-                    dependencies = row['Dependencies'].split('\n')
-                    for dependency in dependencies:
-                        if dependency.strip():
-                            st.markdown(f"- {dependency.strip()}")
-                if 'Documentation Status' in row and not pd.isna(row['Documentation Status']):
-                    st.markdown(f"**Documentation Status:** {row['Documentation Status']}")
+                if submit and repo_url:
+                    # Validate GitHub URL
+                    if not repo_url.startswith("https://github.com/"):
+                        st.warning("Please enter a valid GitHub URL starting with https://github.com/")
+                    else:
+                        # The repository is checked in the background; the link is saved once it is validated
+                        get_github_validator().check(repo_url)
+                        st.session_state.setdefault('pending_github_links', {})[project_name] = repo_url
+    
+    # Links submitted earlier, still being validated in the background
+    if st.session_state.get('pending_github_links'):
+        st.fragment(link_pending_github_repos, run_every=1)()
+    
+    return filtered_df, (status_filter, category_filter, priority_filter, tech_filter, search_query)
+
+# Save the GitHub links whose background validation finished, run as a timed fragment
+def link_pending_github_repos():
+    validator = get_github_validator()
+    pending = st.session_state['pending_github_links']
+    statuses = {project: validator.check(url) for project, url in pending.items()}
+    for project, status in statuses.items():
+        if status == github_client.PENDING:
+            st.info(f"Checking the GitHub repository of {project}...")
+            continue
+        url = pending.pop(project)
+        if status == github_client.INVALID:
+            st.session_state['github_link_message'] = ('error', "Invalid GitHub URL. Please check the format and ensure the repository exists.")
+            continue
+        try:
+            get_github_links().set(project, url)
+            st.session_state['github_link_message'] = ('success', f"GitHub repository linked to {project}!")
+        except sqlite3.Error as e:
+            st.session_state['github_link_message'] = ('error', f"Failed to save GitHub repository link ({e}). Please try again.")
+    if len(pending) < len(statuses):
+        # Show the new links (or the error) in a full rerun
+        st.rerun()
 
 # For displaying cycling routes
 def display_cycling_routes(df):
@@ -1283,71 +823,78 @@ def display_cycling_routes(df):
         st.info("No cycling route data available. Please upload GPS data with latitude and longitude coordinates.")
         
         # File uploader for GPS data
-        uploaded_file = st.file_uploader("Upload cycling GPS data (CSV with lat, lon columns)", type="csv")
+        uploaded_file = st.file_uploader("Upload cycling GPS data (CSV with lat, lon columns, GPX, TCX or FIT)",
+                                         type=list(cycling_routes.ROUTE_FILE_TYPES))
         if uploaded_file is not None:
-            cycling_data = pd.read_csv(uploaded_file)
-            if 'lat' in cycling_data.columns and 'lon' in cycling_data.columns:
-                # Display the map
-                st.map(cycling_data)
-                
-                # Display additional statistics if available
-                if 'distance' in cycling_data.columns:
-                    st.metric("Total Distance", f"{cycling_data['distance'].sum():.2f} km")
-                if 'duration' in cycling_data.columns:
-                    st.metric("Total Duration", f"{cycling_data['duration'].sum():.2f} min")
-            else:
-                st.error("Uploaded file must contain 'lat' and 'lon' columns.")
+            # Parsed into float32 arrays and cached by file hash (see cycling_routes.py)
+            try:
+                track = cycling_routes.load_route(uploaded_file.getvalue(), uploaded_file.name)
+            except ValueError as e:
+                st.error(str(e))
+                return
+            
+            # Display the map with a simplified track
+            points = cycling_routes.map_points(track['lat'], track['lon'])
+            st.map(points)
+            st.caption(f"Showing {len(points):,} of {len(track['lat']):,} GPS points")
+            
+            # Ride statistics derived from the points, computed once per route (see route_analytics.py)
+            stats = route_analytics.get_route_analytics(track)
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Total Distance", f"{stats['distance_m'] / 1000:.2f} km")
+            if stats['moving_s'] is not None:
+                col2.metric("Moving Time", route_analytics.format_duration(stats['moving_s']))
+                col3.metric("Average Speed", f"{stats['avg_speed_kmh']:.1f} km/h",
+                            help=f"Max {stats['max_speed_kmh']:.1f} km/h, elapsed {route_analytics.format_duration(stats['elapsed_s'])}")
+            elif track['totals']['duration'] is not None:
+                col2.metric("Total Duration", f"{track['totals']['duration']:.2f} min")
+            if stats['elevation_gain_m'] is not None:
+                col4.metric("Elevation Gain", f"{stats['elevation_gain_m']:.0f} m")
+            
+            if len(stats['splits']):
+                with st.expander("Per-km splits"):
+                    st.dataframe(stats['splits'], hide_index=True, use_container_width=True)
     else:
         # If lat/lon data is already in the dataframe
-        st.map(df[['lat', 'lon']])
+        located = df[['lat', 'lon']].dropna()
+        st.map(cycling_routes.map_points(located['lat'].to_numpy(np.float32), located['lon'].to_numpy(np.float32)))
 
 # Add notification system for deadlines
-def display_notifications(df):
+def display_notifications(df, data_key):
     if not df.empty and 'Last Updated' in df.columns:
         st.markdown("---")
         st.markdown("<div class='section-header'><h2>Notifications</h2></div>", unsafe_allow_html=True)
     
-        # Calculate days since last update for each project
-        current_date = pd.Timestamp(datetime.now().date())
+        # Raise and resolve alerts for the projects changed since the last sync only
+        store = get_notification_store()
+        store.sync(df, data_key)
         
-        # Create a DataFrame for notifications
-        notification_data = []
+        # Days since last update and priority flags for all projects at once (see project_notifications.py)
+        notifications = load_notifications(data_key, datetime.now().strftime('%Y-%m-%d'), df)
         
-        for _, row in df.iterrows():
-            if 'Last Updated' in row and not pd.isna(row['Last Updated']):
-                # Ensure last_updated is a pandas Timestamp for consistent type comparison
-                last_updated = pd.Timestamp(row['Last Updated']) if isinstance(row['Last Updated'], datetime) else pd.Timestamp(row['Last Updated'])
-                days_since_update = (current_date - last_updated).days
-                
-                # Add notifications for projects not updated recently
-                if days_since_update > 30:
-                    notification_data.append({
-                        'Project': row.get('Project Name', 'Unknown Project'),
-                        'Notification': f"Not updated for {days_since_update} days",
-                        'Type': 'Warning',
-                        'Days': days_since_update
-                    })
-                
-                # Add notifications for high priority projects
-                if 'Priority' in row and row['Priority'] == 'High':
-                    notification_data.append({
-                        'Project': row.get('Project Name', 'Unknown Project'),
-                        'Notification': "High priority project",
-                        'Type': 'Info',
-                        'Days': days_since_update
-                    })
-        
-        if notification_data:
-            notification_df = pd.DataFrame(notification_data)
-            
-            # Display notifications
-            for _, notif in notification_df.iterrows():
-                if notif['Type'] == 'Warning':
-                    st.warning(f"**{notif['Project']}**: {notif['Notification']}")
-                else:
-                    st.info(f"**{notif['Project']}**: {notif['Notification']}")
-        else:
+        if notifications.empty:
             st.success("No notifications at this time.")
+            return
+        
+        # Counts first, then a compact paginated feed sorted by severity and age
+        counts = project_notifications.notification_counts(notifications)
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Unread", store.unread_count)
+        col2.metric("Not updated recently", counts[project_notifications.STALE])
+        col3.metric("High priority projects", counts[project_notifications.HIGH_PRIORITY])
+        
+        page_count = project_timeline.page_count(len(notifications), project_notifications.NOTIFICATIONS_PER_PAGE)
+        feed_page = 1
+        if page_count > 1:
+            feed_page = st.number_input(f"Notification page ({page_count} pages)",
+                                        min_value=1, max_value=page_count, value=1, step=1)
+        page = project_notifications.feed_page(notifications, feed_page)
+        page = page.assign(New=[store.is_unread(project, kind) for project, kind in zip(page['Project'], page['Type'])])
+        st.dataframe(page, hide_index=True, use_container_width=True)
+        
+        if store.unread_count and st.button("Mark all notifications as read"):
+            store.acknowledge()
+            st.rerun()
 
 # Define display_footer function
 def display_footer():
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+project_data.py
+
+Data helpers used by project_dashboard.py: a typed columnar mirror of the
+projects CSV, merging of duplicate project rows coming from the different
+imports (Lovable, WebSim, Bolt, ...) and the normalized project/technology
+table derived from 'Tech Stack'.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+
+# Directory (next to the CSV) holding the columnar mirrors
+MIRROR_DIR_NAME = '.dashboard_cache'
+
+# Columns stored with a categorical dtype and columns parsed as dates
+CATEGORICAL_COLUMNS = ('Category', 'Status', 'Priority')
+DATE_COLUMNS = ('Last Updated',)
+
+# Canonical technology names, keyed by lowercase spelling
+TECH_ALIASES = {
+    'inconnu': 'Unknown',
+    'unknown': 'Unknown',
+    'js': 'JavaScript',
+    'javascript': 'JavaScript',
+    'ts': 'TypeScript',
+    'typescript': 'TypeScript',
+    'node': 'Node.js',
+    'nodejs': 'Node.js',
+    'next': 'Next.js',
+    'nextjs': 'Next.js',
+    'vue': 'Vue.js',
+    'vuejs': 'Vue.js',
+    'reactjs': 'React',
+    'react.js': 'React',
+    'tailwind': 'Tailwind CSS',
+    'tailwindcss': 'Tailwind CSS',
+    'postgres': 'PostgreSQL',
+    'mongo': 'MongoDB',
+    'remix framework': 'Remix',
+    'ci/cd': 'CI/CD',
+    'ui/ux': 'UI/UX',
+    'ai/ml': 'AI/ML',
+    'shadcn/ui': 'shadcn/ui',
+}
+
+# Technology names containing a '/' that must not be split
+COMPOUND_TECHS = ('CI/CD', 'UI/UX', 'AI/ML', 'shadcn/ui')
+_COMPOUND_PATTERN = re.compile('|'.join(re.escape(name) for name in COMPOUND_TECHS), re.IGNORECASE)
+_TECH_SEPARATOR = re.compile(r'[,/]')
+
+# Columns that are never merged: the key itself and the CSV index column
+MERGE_SKIP_COLUMNS = ('Project Name', 'Unnamed: 0')
+
+
+def _merge_scores(df):
+    """Score every cell for the "longest non-empty value wins" rule.
+
+    Strings score their length, other non-null values score 0 and empty or
+    missing values score -1 so they can never be picked.
+    """
+    scores = {}
+    for col in df.columns:
+        values = df[col]
+        valid = values.notna().to_numpy()
+        score = np.zeros(len(values), dtype=np.int64)
+        if not pd.api.types.is_numeric_dtype(values.dtype):
+            try:
+                # NaN for non-string cells, which then score 0 like the rest
+                lengths = values.str.len()
+            except (AttributeError, TypeError):
+                lengths = None
+            if lengths is not None:
+                valid &= (lengths != 0).to_numpy()
+                score = lengths.fillna(0).to_numpy(dtype=np.int64)
+        scores[col] = np.where(valid, score, -1)
+    return pd.DataFrame(scores)
+
+
+def merge_duplicate_projects(df):
+    """Merge rows sharing the same 'Project Name' into a single row.
+
+    Unique projects are kept as-is, followed by one merged row per duplicated
+    name (in order of first appearance). For each column the merged row keeps
+    the longest non-empty value among the duplicates, ties going to the first
+    occurrence; when every value is empty the first row's value is kept.
+    The whole merge is a single groupby pass over the duplicated rows.
+    """
+    if df.empty or 'Project Name' not in df.columns:
+        return df
+
+    duplicates = df['Project Name'].duplicated(keep=False).to_numpy()
+    if not duplicates.any():
+        return df.reset_index(drop=True)
+
+    unique_df = df[~duplicates]
+    dup_df = df[duplicates].reset_index(drop=True)
+
+    # Group id per row, numbered in order of first appearance
+    codes, _ = pd.factorize(dup_df['Project Name'], use_na_sentinel=False)
+    first_rows = ~pd.Series(codes).duplicated().to_numpy()
+    merged = dup_df[first_rows].reset_index(drop=True)
+
+    merge_columns = [col for col in dup_df.columns if col not in MERGE_SKIP_COLUMNS]
+    if merge_columns:
+        scores = _merge_scores(dup_df[merge_columns])
+        grouped = scores.groupby(codes, sort=True)
+        # idxmax returns the first row holding the best score of each group
+        best_rows = grouped.idxmax()
+        best_scores = grouped.max()
+
+        for col in merge_columns:
+            has_value = best_scores[col].to_numpy() >= 0
+            if not has_value.any():
+                continue
+            winners = best_rows[col].to_numpy()[has_value]
+            column = merged[col].copy()
+            column.iloc[np.flatnonzero(has_value)] = dup_df[col].to_numpy()[winners]
+            merged[col] = column
+
+    return pd.concat([unique_df, merged], ignore_index=True)
+
+
+def apply_project_dtypes(df):
+    """Give the projects frame its dashboard dtypes.
+
+    Category/Status/Priority become categoricals and 'Last Updated' is parsed
+    as a date. A date column is left untouched if any of its values cannot be
+    parsed, so that saving the frame back never loses information.
+    """
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in DATE_COLUMNS:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            parsed = pd.to_datetime(df[col], errors='coerce', format='ISO8601')
+            if not (parsed.isna() & df[col].notna()).any():
+                df[col] = parsed
+    return df
+
+
+def get_mirror_paths(csv_path):
+    """Return the (mirror, metadata) paths used for a CSV file."""
+    csv_path = Path(csv_path)
+    mirror_dir = csv_path.parent / MIRROR_DIR_NAME
+    return mirror_dir / f"{csv_path.name}.feather", mirror_dir / f"{csv_path.name}.json"
+
+
+def _read_mirror_meta(meta_file):
+    try:
+        with open(meta_file, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path, write):
+    """Write a file through a temporary file and an atomic rename."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _write_mirror(df, mirror_file, meta_file, meta):
+    mirror_file.parent.mkdir(exist_ok=True)
+    _write_atomic(mirror_file, lambda tmp: df.to_feather(tmp, compression='uncompressed'))
+    _write_atomic(meta_file, lambda tmp: tmp.write_text(json.dumps(meta)))
+
+
+def _read_mirror(mirror_file):
+    # Uncompressed Arrow IPC needs no parsing or decompression; to_pandas() still copies
+    # the columns into pandas memory, so the mapping only saves the intermediate read buffer
+    return feather.read_table(mirror_file, memory_map=True).to_pandas()
+
+
+def load_projects(csv_path):
+    """Load the projects CSV through its typed columnar mirror.
+
+    The mirror is an uncompressed Feather (Arrow IPC) file in MIRROR_DIR_NAME.
+    It is rebuilt only when the CSV content changes: a matching mtime/size is
+    trusted as-is, otherwise the CSV is hashed and the mirror reused if the
+    SHA-256 is unchanged.
+    """
+    csv_path = Path(csv_path)
+    mirror_file, meta_file = get_mirror_paths(csv_path)
+    stat = csv_path.stat()
+    meta = _read_mirror_meta(meta_file)
+
+    if meta and mirror_file.exists():
+        if meta.get('mtime_ns') == stat.st_mtime_ns and meta.get('size') == stat.st_size:
+            try:
+                return _read_mirror(mirror_file)
+            except Exception as e:
+                logging.warning(f"Unreadable mirror {mirror_file}, rebuilding: {e}")
+
+    # Hash the exact bytes that get parsed so the metadata matches the mirror
+    data = csv_path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    new_meta = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}
+
+    if meta and meta.get('sha256') == digest and mirror_file.exists():
+        try:
+            df = _read_mirror(mirror_file)
+            # Only the timestamp changed: refresh it to skip hashing next time
+            _write_atomic(meta_file, lambda tmp: tmp.write_text(json.dumps(new_meta)))
+            return df
+        except Exception as e:
+            logging.warning(f"Unreadable mirror {mirror_file}, rebuilding: {e}")
+
+    df = apply_project_dtypes(pd.read_csv(io.BytesIO(data)))
+    try:
+        _write_mirror(df, mirror_file, meta_file, new_meta)
+    except Exception as e:
+        # The dashboard still works from the CSV, just without the fast path
+        logging.warning(f"Could not write mirror for {csv_path}: {e}")
+    return df
+
+
+def save_projects(df, csv_path):
+    """Write a projects frame back to CSV in the same format it was read.
+
+    Parsed date columns are formatted back to 'YYYY-MM' when every value is
+    the first of a month (the format used by the CSV), else to 'YYYY-MM-DD'.
+    """
+    out = df.copy()
+    for col in out.columns:
+        if pd.api.types.is_datetime64_any_dtype(out[col]):
+            dates = out[col].dropna()
+            month_only = (dates.dt.day == 1).all() and (dates == dates.dt.normalize()).all()
+            out[col] = out[col].dt.strftime('%Y-%m' if month_only else '%Y-%m-%d')
+    out.to_csv(csv_path, index=False)
+
+
+def build_technology_table(df):
+    """Normalize 'Tech Stack' into a project/technology association table.
+
+    Stacks are split on ',' and '/' (compound names such as 'CI/CD' are
+    kept), aliases are mapped to canonical names ('Inconnu' -> 'Unknown',
+    'Tailwind' -> 'Tailwind CSS', ...), remaining spellings that only differ
+    in case are merged onto the most frequent one, and each technology is
+    listed once per project. Returns a frame with columns 'row' (position
+    of the project in `df`) and 'Technology', in Tech Stack order.
+    """
+    if 'Tech Stack' not in df.columns:
+        return pd.DataFrame({'row': pd.Series(dtype=np.int64), 'Technology': pd.Series(dtype=object)})
+
+    stacks = df['Tech Stack'].astype(object)
+    present = stacks.notna().to_numpy()
+    stacks = stacks[present].astype(str).set_axis(np.flatnonzero(present))
+    # Protect the '/' of compound names while splitting
+    stacks = stacks.str.replace(_COMPOUND_PATTERN, lambda m: m.group(0).replace('/', '\0'), regex=True)
+    techs = stacks.str.split(_TECH_SEPARATOR).explode().str.strip().str.replace('\0', '/', regex=False)
+    techs = techs[techs.notna() & (techs != '')]
+
+    keys = techs.str.lower()
+    canonical = keys.map(TECH_ALIASES)
+    # Unaliased names: merge case variants onto their most frequent spelling
+    unaliased = canonical.isna()
+    spellings = techs[unaliased].groupby(keys[unaliased]).agg(lambda s: s.value_counts().index[0])
+    canonical = canonical.fillna(keys.map(spellings))
+
+    table = pd.DataFrame({'row': techs.index.to_numpy(dtype=np.int64), 'Technology': canonical.to_numpy()})
+    return table.drop_duplicates().reset_index(drop=True)
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+project_notifications.py
+
+Notification engine of project_dashboard.py.
+
+Notifications are computed with column operations over the parsed
+'Last Updated' column: days since the last update, a staleness flag and a
+high-priority flag for every project at once. The result is one compact
+frame, sorted by severity and age, which the dashboard shows as counts plus
+a paginated feed instead of one alert widget per notification.
+
+NotificationStore remembers which alerts were raised and acknowledged, in a
+SQLite database. Each sync only looks at the projects whose alert-relevant
+fields changed since the last data version (plus those crossing the
+staleness threshold since the last day), and maintains the unread count.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Projects not updated for more than this many days get a warning
+STALE_AFTER_DAYS = 30
+
+# Number of notifications shown per feed page
+NOTIFICATIONS_PER_PAGE = 20
+
+# Notification kinds, in feed order
+STALE = 'Warning'
+HIGH_PRIORITY = 'Info'
+KIND_ORDER = {STALE: 0, HIGH_PRIORITY: 1}
+
+# Raised and acknowledged alerts, next to the other dashboard caches
+NOTIFICATIONS_DB_FILE = Path('.dashboard_cache') / 'notifications.db'
+
+# Columns that decide the notifications of a project
+ALERT_COLUMNS = ('Last Updated', 'Priority')
+
+
+def build_notifications(df, today=None):
+    """Compute every notification of `df` as a frame sorted for the feed.
+
+    Columns are 'Project', 'Notification', 'Type' (Warning or Info) and
+    'Days' (days since the last update). Projects without a valid
+    'Last Updated' date raise no notification.
+    """
+    columns = ['Project', 'Notification', 'Type', 'Days']
+    if df.empty or 'Last Updated' not in df.columns:
+        return pd.DataFrame(columns=columns)
+
+    today = pd.Timestamp(today if today is not None else pd.Timestamp.now().date())
+    last_updated = pd.to_datetime(df['Last Updated'], errors='coerce')
+    dated = last_updated.notna()
+    days = (today - last_updated[dated]).dt.days
+    projects = (df.loc[dated, 'Project Name'].astype(object).fillna('Unknown Project')
+                if 'Project Name' in df.columns
+                else pd.Series('Unknown Project', index=days.index, dtype=object))
+
+    stale = days > STALE_AFTER_DAYS
+    parts = [pd.DataFrame({
+        'Project': projects[stale],
+        'Notification': "Not updated for " + days[stale].astype(str) + " days",
+        'Type': STALE,
+        'Days': days[stale],
+    })]
+    if 'Priority' in df.columns:
+        high = (df.loc[dated, 'Priority'] == 'High').to_numpy()
+        parts.append(pd.DataFrame({
+            'Project': projects[high],
+            'Notification': "High priority project",
+            'Type': HIGH_PRIORITY,
+            'Days': days[high],
+        }))
+
+    notifications = pd.concat(parts, ignore_index=True)
+    order = notifications['Type'].map(KIND_ORDER)
+    notifications = notifications.assign(_order=order).sort_values(['_order', 'Days'], ascending=[True, False],
+                                                                   kind='stable')
+    return notifications.drop(columns='_order').reset_index(drop=True)[columns]
+
+
+def notification_counts(notifications):
+    """Number of notifications of each type, as {type: count}."""
+    counts = notifications['Type'].value_counts()
+    return {kind: int(counts.get(kind, 0)) for kind in KIND_ORDER}
+
+
+def feed_page(notifications, page, per_page=NOTIFICATIONS_PER_PAGE):
+    """Notifications shown on one feed page (1-based)."""
+    return notifications.iloc[(page - 1) * per_page:page * per_page]
+
+
+def _day(today):
+    return pd.Timestamp(today if today is not None else pd.Timestamp.now().date()).normalize()
+
+
+class NotificationStore:
+    """Persistent alert state: raised, resolved and acknowledged notifications.
+
+    Alerts are keyed by (project, type). The store keeps a fingerprint of the
+    alert columns of every project, so a sync recomputes the alerts of the
+    changed projects only. The whole state is mirrored in memory; SQLite
+    holds it across restarts.
+    """
+
+    def __init__(self, db_path=NOTIFICATIONS_DB_FILE):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS projects (project TEXT PRIMARY KEY, fingerprint INTEGER NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS alerts (project TEXT NOT NULL, type TEXT NOT NULL, "
+                         "raised_on TEXT NOT NULL, active INTEGER NOT NULL, acknowledged INTEGER NOT NULL, "
+                         "PRIMARY KEY (project, type))")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._fingerprints = dict(conn.execute("SELECT project, fingerprint FROM projects"))
+            self._alerts = {(project, kind): [bool(active), bool(acknowledged)]
+                            for project, kind, active, acknowledged
+                            in conn.execute("SELECT project, type, active, acknowledged FROM alerts")}
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+        self._synced = (meta.get('data_key'), meta.get('day'))
+        self._unread = sum(active and not acknowledged for active, acknowledged in self._alerts.values())
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @property
+    def unread_count(self):
+        """Number of active alerts not acknowledged yet."""
+        return self._unread
+
+    def sync(self, df, data_key, today=None):
+        """Bring the alerts up to date with `df` and return the delta.
+
+        The delta is {'raised': [(project, type), ...], 'resolved': [...]};
+        it is empty when neither the data version nor the day changed.
+        """
+        day = _day(today)
+        delta = {'raised': [], 'resolved': []}
+        with self._lock:
+            if self._synced == (data_key, day.date().isoformat()):
+                return delta
+
+            df = df.drop_duplicates('Project Name') if 'Project Name' in df.columns else df.iloc[:0]
+            names = df['Project Name'].astype(str).to_numpy()
+            columns = ['Project Name'] + [col for col in ALERT_COLUMNS if col in df.columns]
+            fingerprints = pd.util.hash_pandas_object(df[columns].astype(object), index=False).to_numpy().view(np.int64)
+            # Exact 64-bit comparison: unknown projects get None and always differ
+            known = np.array([self._fingerprints.get(name) for name in names], dtype=object)
+            touched = known != fingerprints.astype(object)
+
+            # Unchanged projects that crossed the staleness threshold since the last sync
+            last_day = self._synced[1]
+            if last_day is not None and last_day != day.date().isoformat() and 'Last Updated' in df.columns:
+                last_updated = pd.to_datetime(df['Last Updated'], errors='coerce')
+                stale_now = ((day - last_updated).dt.days > STALE_AFTER_DAYS).to_numpy()
+                stale_before = ((pd.Timestamp(last_day) - last_updated).dt.days > STALE_AFTER_DAYS).to_numpy()
+                touched |= stale_now != stale_before
+
+            removed = set(self._fingerprints) - set(names)
+            touched_names = set(names[touched])
+            wanted = build_notifications(df[touched], day)
+            wanted = set(zip(wanted['Project'].astype(str), wanted['Type']))
+
+            for project in touched_names | removed:
+                for kind in KIND_ORDER:
+                    state = self._alerts.get((project, kind))
+                    if state and state[0] and (project, kind) not in wanted:
+                        delta['resolved'].append((project, kind))
+            for key in wanted:
+                state = self._alerts.get(key)
+                if state is None or not state[0]:
+                    delta['raised'].append(key)
+
+            with self._connect() as conn:
+                conn.executemany("UPDATE alerts SET active = 0 WHERE project = ? AND type = ?", delta['resolved'])
+                conn.executemany("INSERT INTO alerts (project, type, raised_on, active, acknowledged) "
+                                 "VALUES (?, ?, ?, 1, 0) ON CONFLICT(project, type) DO UPDATE SET "
+                                 "raised_on = excluded.raised_on, active = 1, acknowledged = 0",
+                                 [(project, kind, day.date().isoformat()) for project, kind in delta['raised']])
+                conn.executemany("INSERT OR REPLACE INTO projects (project, fingerprint) VALUES (?, ?)",
+                                 zip(names[touched].tolist(), fingerprints[touched].tolist()))
+                conn.executemany("DELETE FROM projects WHERE project = ?", [(project,) for project in removed])
+                conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                 [('data_key', data_key), ('day', day.date().isoformat())])
+
+            for key in delta['resolved']:
+                self._unread -= not self._alerts[key][1]
+                self._alerts[key][0] = False
+            for key in delta['raised']:
+                self._alerts[key] = [True, False]
+            self._unread += len(delta['raised'])
+            self._fingerprints.update(zip(names[touched].tolist(), fingerprints[touched].tolist()))
+            for project in removed:
+                del self._fingerprints[project]
+            self._synced = (data_key, day.date().isoformat())
+        return delta
+
+    def is_unread(self, project, kind):
+        """Whether the alert (project, kind) is active and not acknowledged."""
+        state = self._alerts.get((project, kind))
+        return bool(state and state[0] and not state[1])
+
+    def acknowledge(self, keys=None):
+        """Mark the given (project, type) alerts as read, or every active alert if None."""
+        with self._lock:
+            if keys is None:
+                keys = [key for key, (active, acknowledged) in self._alerts.items() if active and not acknowledged]
+            keys = list(dict.fromkeys(key for key in keys if key in self._alerts))
+            with self._connect() as conn:
+                conn.executemany("UPDATE alerts SET acknowledged = 1 WHERE project = ? AND type = ?", keys)
+            for key in keys:
+                self._unread -= self._alerts[key][0] and not self._alerts[key][1]
+                self._alerts[key][1] = True
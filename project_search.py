@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+project_search.py
+
+Search and filter engines for the "Project Filters" section of
+project_dashboard.py.
+
+A token-level inverted index over the text fields of the projects is built
+once per data version. Each query word matches every indexed token that
+contains it (so prefixes and inner substrings work too). Candidates are
+found through a trigram index over the vocabulary, and the posting lists of
+the query words are intersected.
+
+Filters use precomputed bitmaps: one packed bit array per value of each
+categorical field and per technology, so any combination of selections is a
+few bitwise ANDs over the bitmaps, without copying the frame.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# Fields indexed for search
+SEARCH_FIELDS = ('Project Name', 'Category', 'Tech Stack', 'Next Actions', 'Résumé_Détaillé', 'Location')
+
+# Fields filtered through bitmaps; 'Tech Stack' uses the normalized technology table
+FILTER_FIELDS = ('Status', 'Category', 'Priority', 'Tech Stack')
+
+TOKEN_PATTERN = re.compile(r'\w+')
+NGRAM_SIZE = 3
+
+
+def tokenize(text):
+    """Lowercase word tokens of a text."""
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def _ngrams(token):
+    return {token[i:i + NGRAM_SIZE] for i in range(len(token) - NGRAM_SIZE + 1)}
+
+
+class SearchIndex:
+    """Inverted index from tokens (and token trigrams) to project rows."""
+
+    def __init__(self, df, fields=SEARCH_FIELDS):
+        self.labels = df.index
+        fields = [field for field in fields if field in df.columns]
+
+        # (row, token) pairs for every indexed field, computed column-wise
+        pairs = []
+        for field in fields:
+            values = df[field].astype(object)
+            texts = values[values.notna()].astype(str).str.lower()
+            tokens = texts.set_axis(np.flatnonzero(values.notna().to_numpy())).str.findall(TOKEN_PATTERN)
+            pairs.append(tokens.explode().dropna())
+        postings = pd.concat(pairs) if pairs else pd.Series(dtype=object)
+        postings = postings.rename('token').rename_axis('row').reset_index().drop_duplicates()
+
+        # Vocabulary and one sorted posting array of row positions per token
+        grouped = postings.groupby('token', sort=True)['row']
+        self.vocabulary = list(grouped.groups.keys())
+        self.postings = [np.sort(rows.to_numpy(dtype=np.int64)) for _, rows in grouped]
+
+        # Trigram -> ids of vocabulary tokens containing it
+        trigram_ids = {}
+        for token_id, token in enumerate(self.vocabulary):
+            for gram in _ngrams(token):
+                trigram_ids.setdefault(gram, []).append(token_id)
+        self.trigrams = {gram: np.array(ids, dtype=np.int64) for gram, ids in trigram_ids.items()}
+
+    def _matching_tokens(self, word):
+        """Ids of the vocabulary tokens containing `word`."""
+        if len(word) < NGRAM_SIZE:
+            # Too short for the trigram index: the vocabulary is small, scan it
+            return [i for i, token in enumerate(self.vocabulary) if word in token]
+        candidates = None
+        for gram in _ngrams(word):
+            ids = self.trigrams.get(gram)
+            if ids is None:
+                return []
+            candidates = ids if candidates is None else np.intersect1d(candidates, ids, assume_unique=True)
+            if not len(candidates):
+                return []
+        # Trigrams can match out of order: confirm the substring
+        return [i for i in candidates if word in self.vocabulary[i]]
+
+    def search_positions(self, query):
+        """Row positions matching every word of `query` (None for an empty query)."""
+        words = tokenize(query)
+        if not words:
+            return None
+        result = None
+        for word in sorted(set(words), key=len, reverse=True):
+            token_ids = self._matching_tokens(word)
+            if not token_ids:
+                return np.array([], dtype=np.int64)
+            rows = np.unique(np.concatenate([self.postings[i] for i in token_ids]))
+            result = rows if result is None else np.intersect1d(result, rows, assume_unique=True)
+            if not len(result):
+                break
+        return result
+
+    def search(self, query):
+        """Index labels of the projects matching `query` (all projects if empty)."""
+        positions = self.search_positions(query)
+        return self.labels if positions is None else self.labels[positions]
+
+
+class FilterIndex:
+    """Packed per-value bitmaps of the filterable fields of the projects.
+
+    Technologies come from the normalized project/technology table (see
+    project_data.build_technology_table), so they are matched exactly and
+    under their canonical names.
+    """
+
+    def __init__(self, df, tech_table, fields=FILTER_FIELDS):
+        self.n_rows = len(df)
+        self.bitmaps = {}
+        for field in fields:
+            if field not in df.columns:
+                continue
+            if field == 'Tech Stack':
+                values, rows = tech_table['Technology'].to_numpy(), tech_table['row'].to_numpy()
+            else:
+                values, rows = df[field].astype(object).to_numpy(), np.arange(self.n_rows)
+            # Missing values are dropped by groupby and never get a bitmap
+            groups = pd.Series(rows).groupby(values).agg(list).to_dict()
+            self.bitmaps[field] = {value: self._bitmap(rows) for value, rows in groups.items()}
+
+    def _bitmap(self, rows):
+        bits = np.zeros(self.n_rows, dtype=bool)
+        bits[np.asarray(rows, dtype=np.int64)] = True
+        return np.packbits(bits)
+
+    def values(self, field):
+        """Sorted values available for a field (empty if the field is missing)."""
+        return sorted(self.bitmaps.get(field, {}), key=str)
+
+    def mask(self, selections, positions=None):
+        """Boolean row mask for `selections` ({field: value}, 'All' meaning no filter).
+
+        `positions`, if given, further restricts the result to those row
+        positions (e.g. the result of a search).
+        """
+        packed = np.full((self.n_rows + 7) // 8, 0xFF, dtype=np.uint8)
+        for field, value in selections.items():
+            if value == 'All' or field not in self.bitmaps:
+                continue
+            bitmap = self.bitmaps[field].get(value)
+            if bitmap is None:
+                return np.zeros(self.n_rows, dtype=bool)
+            packed &= bitmap
+        mask = np.unpackbits(packed, count=self.n_rows).astype(bool)
+        if positions is not None:
+            restricted = np.zeros(self.n_rows, dtype=bool)
+            restricted[positions] = True
+            mask &= restricted
+        return mask
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+project_timeline.py
+
+Data preparation and figure building for the Project Timeline (Gantt chart)
+of project_dashboard.py.
+
+Each status is drawn as a single trace: every project contributes a
+start -> end segment, and segments are separated by None gaps. The figure
+therefore has O(statuses) traces instead of several traces per project, and
+switches to WebGL (Scattergl) for large views.
+
+Large timelines are browsed in windows (pages of projects, optionally
+restricted to a date range). Only the visible window is turned into a figure,
+and TimelineWindowCache builds the adjacent windows in a background thread.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Define colors for different statuses - using more vibrant colors
+STATUS_COLORS = {
+    'Active': '#00E676',      # Vibrant green
+    'On Hold': '#FFAB00',     # Vibrant amber
+    'Completed': '#2979FF',   # Vibrant blue
+    'Abandoned': '#FF1744',   # Vibrant red
+    'In Progress': '#651FFF', # Vibrant purple
+    'Planned': '#00B0FF',     # Vibrant light blue
+    'Testing': '#FF9100',     # Vibrant orange
+    'Reviewing': '#F50057'    # Vibrant pink
+}
+# Default is a vibrant teal instead of grey if status not in map
+DEFAULT_STATUS_COLOR = '#00BCD4'
+
+# Above this many projects, traces are rendered with WebGL
+WEBGL_THRESHOLD = 500
+
+# Number of projects shown per timeline window
+TIMELINE_PAGE_SIZE = 100
+
+# Optional columns appended to the hover text, with their labels
+HOVER_COLUMNS = (('Category', 'Category'), ('Priority', 'Priority'), ('Tech Stack', 'Tech Stack'))
+
+
+def prepare_timeline_data(df, status_filter=None, category_filter=None, priority_filter=None):
+    """Filter the projects and compute their Start/End/Target dates.
+
+    Start is the 'Creation Date' when available, otherwise 30 days before
+    'Last Updated'; End is 'Last Updated'. Rows without valid dates are
+    dropped and the result is sorted by start date.
+    """
+    mask = pd.Series(True, index=df.index)
+    if status_filter and 'Status' in df.columns:
+        mask &= df['Status'].isin(status_filter)
+    if category_filter and 'Category' in df.columns:
+        mask &= df['Category'].isin(category_filter)
+    if priority_filter and 'Priority' in df.columns:
+        mask &= df['Priority'].isin(priority_filter)
+
+    last_updated = pd.to_datetime(df.loc[mask, 'Last Updated'], errors='coerce')
+    columns = {}
+    if 'Creation Date' in df.columns:
+        columns['Start'] = pd.to_datetime(df.loc[mask, 'Creation Date'], errors='coerce')
+    else:
+        # If no creation date, use a date 30 days before Last Updated
+        columns['Start'] = last_updated - pd.Timedelta(days=30)
+    columns['End'] = last_updated
+    # Add target completion date as a milestone
+    if 'Target Completion' in df.columns:
+        columns['Target'] = pd.to_datetime(df.loc[mask, 'Target Completion'], errors='coerce')
+
+    timeline_df = df[mask].assign(**columns)
+    timeline_df = timeline_df.dropna(subset=['Start', 'End'])
+    return timeline_df.sort_values('Start', kind='stable')
+
+
+def slice_by_dates(timeline_df, start=None, end=None):
+    """Keep the projects whose [Start, End] span overlaps the [start, end] range."""
+    mask = pd.Series(True, index=timeline_df.index)
+    if start is not None:
+        mask &= timeline_df['End'] >= pd.Timestamp(start)
+    if end is not None:
+        mask &= timeline_df['Start'] <= pd.Timestamp(end)
+    return timeline_df[mask]
+
+
+def page_count(n_items, page_size=TIMELINE_PAGE_SIZE):
+    """Number of pages of `page_size` items needed to show `n_items` (at least 1).
+
+    Also used for the project cards and the notification feed.
+    """
+    return max(1, -(-n_items // page_size))
+
+
+def timeline_window(timeline_df, page, page_size=TIMELINE_PAGE_SIZE):
+    """Return one page of a start-sorted timeline, page 1 holding the most recent projects."""
+    end = len(timeline_df) - (page - 1) * page_size
+    return timeline_df.iloc[max(0, end - page_size):max(0, end)]
+
+
+def _hover_texts(timeline_df, statuses):
+    """Build the hover text of every project with column-wise string operations."""
+    duration = (timeline_df['End'] - timeline_df['Start']).dt.days.astype(str)
+    text = (
+        "<b>" + timeline_df['Project Name'].astype(str) + "</b><br>" +
+        "Status: " + statuses + "<br>" +
+        "Duration: " + duration + " days<br>" +
+        "Start: " + timeline_df['Start'].dt.strftime('%Y-%m-%d') + "<br>" +
+        "Last Update: " + timeline_df['End'].dt.strftime('%Y-%m-%d') + "<br>"
+    )
+    for col, label in HOVER_COLUMNS:
+        if col in timeline_df.columns:
+            values = timeline_df[col].astype(object)
+            text += (f"{label}: " + values.astype(str) + "<br>").where(values.notna(), '')
+    return text
+
+
+def _interleave(starts, ends, gap=None):
+    """Return [s0, e0, gap, s1, e1, gap, ...] as an object array."""
+    if np.issubdtype(starts.dtype, np.datetime64):
+        # Microsecond precision converts to datetime objects rather than integers
+        starts, ends = starts.astype('datetime64[us]'), ends.astype('datetime64[us]')
+    out = np.empty(len(starts) * 3, dtype=object)
+    out[0::3] = starts
+    out[1::3] = ends
+    out[2::3] = gap
+    return out
+
+
+def build_timeline_figure(timeline_df):
+    """Build the Gantt figure: one trace per status plus one for target dates."""
+    use_webgl = len(timeline_df) > WEBGL_THRESHOLD
+    scatter = go.Scattergl if use_webgl else go.Scatter
+
+    statuses = (timeline_df['Status'].astype(object).fillna('Unknown').astype(str)
+                if 'Status' in timeline_df.columns
+                else pd.Series('Unknown', index=timeline_df.index))
+    hover = _hover_texts(timeline_df, statuses)
+    names = timeline_df['Project Name'].astype(str)
+
+    # Rows of each status; with sort=False the groups (and legend) follow first appearance
+    rows_by_status = statuses.groupby(statuses, sort=False).groups
+
+    fig = go.Figure()
+    for rank, (status, rows) in enumerate(rows_by_status.items()):
+        color = STATUS_COLORS.get(status, DEFAULT_STATUS_COLOR)
+        group_hover = hover.loc[rows].to_numpy()
+        group_names = names.loc[rows].to_numpy()
+        sizes = np.tile(np.array([8, 10, 0]), len(rows))
+        fig.add_trace(scatter(
+            x=_interleave(timeline_df.loc[rows, 'Start'].to_numpy(), timeline_df.loc[rows, 'End'].to_numpy()),
+            y=_interleave(group_names, group_names),
+            mode='lines+markers',
+            line=dict(color=color, width=3),
+            marker=dict(
+                symbol='circle',
+                size=sizes,
+                color=color,
+                line=dict(width=1, color='white')
+            ),
+            name=status,
+            legendgroup=status,
+            legendrank=rank,
+            hoverinfo='text',
+            hovertext=_interleave(group_hover, group_hover, ''),
+            connectgaps=False,
+        ))
+
+    if 'Target' in timeline_df.columns:
+        targets = timeline_df[timeline_df['Target'].notna()]
+        if not targets.empty:
+            fig.add_trace(scatter(
+                x=targets['Target'],
+                y=targets['Project Name'].astype(str),
+                mode='markers',
+                marker=dict(
+                    symbol='diamond',
+                    size=10,
+                    color='rgba(255,255,255,0.9)',  # White fill
+                    line=dict(width=2, color='#E91E63'),  # Pink border
+                ),
+                name='Target Date',
+                legendrank=len(rows_by_status),
+                hoverinfo='text',
+                hovertext="<b>Target Completion:</b> " + targets['Target'].dt.strftime('%Y-%m-%d'),
+                legendgroup='Target'
+            ))
+
+    # Update layout for better appearance
+    fig.update_layout(
+        title='Project Timeline (Gantt Chart)',
+        height=max(500, min(len(timeline_df) * 20, 1000)),  # Hauteur limitée entre 500 et 1000px
+        margin=dict(l=20, r=20, t=60, b=30),  # Marges plus grandes
+        plot_bgcolor='rgba(250, 250, 250, 0.9)',  # Fond légèrement grisé pour meilleur contraste
+        yaxis=dict(
+            autorange="reversed",  # Reverses the y-axis so newest projects are at top
+            title='',
+            tickangle=-30,  # Angle des noms de projets pour éviter le chevauchement
+            tickfont=dict(size=11),  # Smaller font for project names
+            type='category',
+            # Keep projects in start-date order although traces are grouped by status
+            categoryorder='array',
+            categoryarray=names.tolist(),
+        ),
+        xaxis=dict(
+            title='Timeline',
+            type='date',
+            gridcolor='rgba(240, 240, 240, 0.9)',  # Lighter grid lines
+            zeroline=False,  # Remove zero line for cleaner look
+        ),
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=12,
+            font_family="Arial",
+            bordercolor='rgba(0,0,0,0.1)',  # Subtle border
+        ),
+        uniformtext=dict(minsize=8, mode='hide'),  # Consistent text size
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            bgcolor='rgba(255,255,255,0.8)',
+        ),
+    )
+    return fig
+
+
+class TimelineWindowCache:
+    """Timeline figures per window, with neighbouring windows prefetched.
+
+    Figures are keyed by (view key, page, page size), where the view key
+    identifies the data version, filters and date range. The requested
+    window is built inline if needed; the previous and next windows are then
+    submitted to a single background worker so that paging is instant.
+    """
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='timeline-prefetch')
+
+    def _store(self, key, future):
+        self._figures[key] = future
+        self._figures.move_to_end(key)
+        while len(self._figures) > self.max_entries:
+            self._figures.popitem(last=False)
+
+    def _prefetch(self, view_key, timeline_df, page, page_size):
+        key = (view_key, page, page_size)
+        with self._lock:
+            if key in self._figures:
+                return
+            self._store(key, self._executor.submit(
+                lambda: build_timeline_figure(timeline_window(timeline_df, page, page_size))))
+
+    def get_figure(self, view_key, timeline_df, page, page_size=TIMELINE_PAGE_SIZE):
+        """Return the figure of one window and start building its neighbours."""
+        key = (view_key, page, page_size)
+        with self._lock:
+            future = self._figures.get(key)
+            if future is not None:
+                self._figures.move_to_end(key)
+
+        if future is None or (future.done() and future.exception() is not None):
+            future = Future()
+            future.set_result(build_timeline_figure(timeline_window(timeline_df, page, page_size)))
+            with self._lock:
+                self._store(key, future)
+
+        n_pages = page_count(len(timeline_df), page_size)
+        for neighbour in (page + 1, page - 1):
+            if 1 <= neighbour <= n_pages:
+                self._prefetch(view_key, timeline_df, neighbour, page_size)
+        return future.result()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+report_export.py
+
+PDF report export of project_dashboard.py.
+
+The project table is written from column arrays (no per-row Series) straight
+to a temporary file, on a background worker, so the Streamlit script thread
+never waits for FPDF. ReportExporter keeps the finished reports on disk,
+keyed by data version and filter set, and the dashboard serves them through
+st.download_button instead of embedding them in the page.
+"""
+
+import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+from fpdf import FPDF
+
+# Columns of the report table: (column, cell width, max characters)
+REPORT_COLUMNS = (
+    ('Project Name', 60, 28),
+    ('Status', 40, None),
+    ('Category', 40, None),
+    ('Priority', 40, None),
+)
+
+
+def _pdf_text(value):
+    # FPDF core fonts only cover Latin-1
+    return str(value).encode('latin-1', 'replace').decode('latin-1')
+
+
+def _column_texts(df, col, max_chars=None):
+    """Cell texts of one report column, 'Unknown' for missing values or columns."""
+    if col not in df.columns:
+        return np.full(len(df), 'Unknown', dtype=object)
+    values = df[col].astype(object)
+    texts = values.where(values.notna(), 'Unknown').astype(str)
+    if max_chars:
+        texts = texts.str[:max_chars]
+    return texts.map(_pdf_text).to_numpy()
+
+
+def write_report(df, path, title="Project Management Dashboard"):
+    """Write the PDF report of `df` (metrics and project table) to `path`."""
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 16)
+    pdf.cell(190, 10, title, ln=True, align="C")
+    pdf.set_font("Arial", "", 12)
+    pdf.cell(190, 10, f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True, align="C")
+    pdf.ln(10)
+
+    # Add dashboard metrics
+    pdf.set_font("Arial", "B", 14)
+    pdf.cell(190, 10, "Dashboard Metrics", ln=True)
+    pdf.set_font("Arial", "", 12)
+    pdf.cell(190, 8, f"Projects: {len(df)}", ln=True)
+    if 'Status' in df.columns:
+        pdf.cell(190, 8, f"Active Projects: {int((df['Status'] == 'Active').sum())}", ln=True)
+    if 'Priority' in df.columns:
+        pdf.cell(190, 8, f"High Priority: {int((df['Priority'] == 'High').sum())}", ln=True)
+    pdf.ln(5)
+
+    # Create a table of project data
+    pdf.set_font("Arial", "B", 12)
+    for i, (col, width, _) in enumerate(REPORT_COLUMNS):
+        pdf.cell(width, 10, col, border=1, ln=i == len(REPORT_COLUMNS) - 1)
+
+    pdf.set_font("Arial", "", 10)
+    widths = [width for _, width, _ in REPORT_COLUMNS]
+    columns = [_column_texts(df, col, max_chars) for col, _, max_chars in REPORT_COLUMNS]
+    last = len(widths) - 1
+    for cells in zip(*columns):
+        for i, text in enumerate(cells):
+            pdf.cell(widths[i], 10, text, border=1, ln=i == last)
+
+    pdf.output(str(path), 'F')
+    return path
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class ReportExporter:
+    """Reports built on a background worker and kept as files, keyed by view.
+
+    The key identifies the exported view (data version and filters); the
+    oldest reports are dropped beyond `max_entries`. Each file lives as long
+    as its future: a dropped report stays readable wherever its future is
+    still held, and its file is removed once the future is garbage-collected.
+    """
+
+    def __init__(self, export_dir=None, max_entries=8):
+        self.export_dir = export_dir or tempfile.mkdtemp(prefix='dashboard-reports-')
+        self.max_entries = max_entries
+        self._reports = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='report-export')
+
+    def _build(self, df, path):
+        try:
+            return write_report(df, path)
+        except BaseException:
+            _remove_quietly(path)
+            raise
+
+    def get(self, key):
+        """Future of the report of `key`, or None if it was never requested."""
+        with self._lock:
+            future = self._reports.get(key)
+            if future is not None:
+                self._reports.move_to_end(key)
+            return future
+
+    def submit(self, key, df):
+        """Return the future of the report of `key` (its file path), starting to build it if needed.
+
+        A report whose build failed is built again.
+        """
+        with self._lock:
+            future = self._reports.get(key)
+            if future is not None and not (future.done() and future.exception() is not None):
+                self._reports.move_to_end(key)
+                return future
+            fd, path = tempfile.mkstemp(suffix='.pdf', dir=self.export_dir)
+            os.close(fd)
+            future = self._executor.submit(self._build, df, path)
+            weakref.finalize(future, _remove_quietly, path)
+            self._reports[key] = future
+            self._reports.move_to_end(key)
+            while len(self._reports) > self.max_entries:
+                self._reports.popitem(last=False)
+            return future
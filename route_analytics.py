@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+route_analytics.py
+
+Ride statistics for the "Cycling Activity Routes" section of
+project_dashboard.py, derived from the raw points of a route (see
+route_files.py): distance, speed, elevation gain, moving time and per-km
+splits.
+
+Everything is computed with numpy over whole arrays: segment lengths with
+the haversine formula, and per-km splits with np.bincount, with no loop over
+points. Results are cached per route (by its content hash).
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+from cachetools import LRUCache
+
+EARTH_RADIUS_M = 6_371_008.8
+
+# Segments slower than this are stops, not moving time
+MOVING_SPEED_KMH = 2.0
+
+# Gaps between two points longer than this (paused recording) are not moving time
+MAX_MOVING_GAP_S = 60
+
+# Window of the moving average applied to elevations before summing climbs
+ELEVATION_SMOOTHING = 5
+
+# Number of analysed routes kept in memory
+ANALYTICS_CACHE_SIZE = 8
+
+_analytics_cache = LRUCache(maxsize=ANALYTICS_CACHE_SIZE)
+_analytics_lock = threading.Lock()
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """Great-circle distance in meters between arrays of points (degrees)."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(a, dtype=np.float64)) for a in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _smoothed(values, window=ELEVATION_SMOOTHING):
+    """Moving average of `values` (same length), ignoring NaNs."""
+    if len(values) < window:
+        return values
+    valid = ~np.isnan(values)
+    kernel = np.ones(window)
+    sums = np.convolve(np.where(valid, values, 0.0), kernel, mode='same')
+    counts = np.convolve(valid.astype(np.float64), kernel, mode='same')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts
+
+
+def analyze_route(route):
+    """Compute the statistics of a route dict.
+
+    Returns a dict with 'distance_m', 'elevation_gain_m' (None without
+    elevations), 'elapsed_s', 'moving_s', 'avg_speed_kmh' (over moving time),
+    'max_speed_kmh' (None without any valid timestamp; points with missing
+    times are skipped) and 'splits', a frame with one row per started
+    kilometer.
+    """
+    lat, lon = route['lat'], route['lon']
+    segments = haversine(lat[:-1], lon[:-1], lat[1:], lon[1:]) if len(lat) > 1 else np.empty(0)
+    cumulative = np.concatenate(([0.0], np.cumsum(segments)))
+    # Kilometer of each segment, from the distance at its start
+    split_of_segment = (cumulative[:-1] // 1000).astype(np.int64)
+    n_splits = int(split_of_segment.max()) + 1 if len(segments) else 0
+
+    stats = {
+        'distance_m': float(cumulative[-1]),
+        'elevation_gain_m': None,
+        'elapsed_s': None,
+        'moving_s': None,
+        'avg_speed_kmh': None,
+        'max_speed_kmh': None,
+    }
+    splits = {
+        'Km': np.arange(1, n_splits + 1),
+        'Distance (km)': np.bincount(split_of_segment, weights=segments, minlength=n_splits) / 1000,
+    }
+
+    if route.get('ele') is not None and len(segments):
+        climbs = np.diff(_smoothed(route['ele'].astype(np.float64)))
+        climbs = np.where(climbs > 0, climbs, 0.0)  # NaN and descents count as 0
+        stats['elevation_gain_m'] = float(climbs.sum())
+        splits['Elevation Gain (m)'] = np.bincount(split_of_segment, weights=climbs, minlength=n_splits)
+
+    time = route.get('time')
+    missing = np.isnat(np.asarray(time, dtype='datetime64[ns]')) if time is not None else None
+    if missing is not None and len(segments) and not missing.all():
+        # NaT casts to a huge negative number, not NaN: measure from the first valid time instead
+        time = np.asarray(time, dtype='datetime64[ns]')
+        seconds = (time - time[~missing][0]).astype('timedelta64[ms]').astype(np.float64) / 1000
+        seconds[missing] = np.nan
+        durations = np.diff(seconds)
+        valid = ~np.isnan(durations) & (durations > 0)  # segments touching a missing time are invalid
+        with np.errstate(invalid='ignore', divide='ignore'):
+            speeds = np.where(valid, segments / np.where(valid, durations, 1) * 3.6, 0.0)
+        moving = valid & (speeds >= MOVING_SPEED_KMH) & (durations <= MAX_MOVING_GAP_S)
+        moving_durations = np.where(moving, durations, 0.0)
+
+        stats['elapsed_s'] = float(np.nanmax(seconds) - np.nanmin(seconds))
+        stats['moving_s'] = float(moving_durations.sum())
+        moving_distance = float(segments[moving].sum())
+        stats['avg_speed_kmh'] = moving_distance / stats['moving_s'] * 3.6 if stats['moving_s'] else 0.0
+        stats['max_speed_kmh'] = float(speeds[moving].max()) if moving.any() else 0.0
+
+        split_moving_s = np.bincount(split_of_segment, weights=moving_durations, minlength=n_splits)
+        split_moving_m = np.bincount(split_of_segment, weights=np.where(moving, segments, 0.0), minlength=n_splits)
+        splits['Moving Time (s)'] = split_moving_s
+        with np.errstate(invalid='ignore', divide='ignore'):
+            splits['Speed (km/h)'] = np.where(split_moving_s > 0, split_moving_m / split_moving_s * 3.6, np.nan)
+
+    stats['splits'] = pd.DataFrame(splits)
+    return stats
+
+
+def get_route_analytics(route):
+    """Statistics of a route, computed once per route hash (see cycling_routes.load_route).
+
+    The returned dict is shared between reruns and sessions and must not be
+    modified by callers.
+    """
+    key = route.get('hash')
+    if key is None:
+        return analyze_route(route)
+    with _analytics_lock:
+        stats = _analytics_cache.get(key)
+    if stats is None:
+        stats = analyze_route(route)
+        with _analytics_lock:
+            _analytics_cache[key] = stats
+    return stats
+
+
+def format_duration(seconds):
+    """Seconds as H:MM:SS."""
+    seconds = int(round(seconds))
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
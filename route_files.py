@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+route_files.py
+
+Parsers for the route files accepted by the "Cycling Activity Routes"
+section of project_dashboard.py: GPX and TCX (XML) and FIT (binary).
+
+XML files are stream-parsed with iterparse. Each track point is read when
+its element ends and is then removed from the tree, so memory does not grow
+with the ride. FIT files are decoded message by message with precompiled
+struct formats, and only the fields needed for routes are kept: position,
+altitude and timestamp.
+
+Every parser returns a route dict: 'lat' and 'lon' as float32 arrays, 'ele'
+as a float32 array (NaN where unknown) or None, and 'time' as a
+datetime64[ns] array (UTC) or None.
+"""
+
+import struct
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pandas as pd
+
+# FIT epoch (1989-12-31 00:00:00 UTC) as a Unix timestamp
+FIT_EPOCH = 631065600
+
+# FIT global message number and field numbers of track points
+FIT_RECORD = 20
+FIT_TIMESTAMP = 253
+FIT_LAT, FIT_LON, FIT_ALTITUDE, FIT_ENHANCED_ALTITUDE = 0, 1, 2, 78
+
+# struct format of the FIT base types (by base type number), with their invalid value
+FIT_BASE_TYPES = {
+    0x00: ('B', 0xFF), 0x01: ('b', 0x7F), 0x02: ('B', 0xFF),
+    0x83: ('h', 0x7FFF), 0x84: ('H', 0xFFFF), 0x85: ('i', 0x7FFFFFFF), 0x86: ('I', 0xFFFFFFFF),
+    0x88: ('f', None), 0x89: ('d', None),
+    0x0A: ('B', 0x00), 0x8B: ('H', 0x0000), 0x8C: ('I', 0x00000000),
+    0x8E: ('q', 0x7FFFFFFFFFFFFFFF), 0x8F: ('Q', 0xFFFFFFFFFFFFFFFF), 0x90: ('Q', 0),
+}
+
+SEMICIRCLES_TO_DEGREES = 180 / 2 ** 31
+
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def _route(lat, lon, ele=None, time=None):
+    """Build a route dict from coordinate lists, dropping points without a position."""
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    located = ~(np.isnan(lat) | np.isnan(lon))
+    route = {'lat': lat[located].astype(np.float32), 'lon': lon[located].astype(np.float32), 'ele': None, 'time': None}
+    if ele is not None:
+        ele = np.asarray(ele, dtype=np.float64)[located]
+        if not np.isnan(ele).all():
+            route['ele'] = ele.astype(np.float32)
+    if time is not None:
+        time = np.asarray(time)[located]
+        if len(time) and pd.notna(time).any():
+            route['time'] = time
+    return route
+
+
+def _iter_points(xml_file, point_tags):
+    """Yield the point elements (local names in `point_tags`) of an XML file, freeing each one afterwards."""
+    parents = []
+    for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+        if event == 'start':
+            parents.append(elem)
+            continue
+        parents.pop()
+        if _local_name(elem.tag) in point_tags:
+            yield elem
+            elem.clear()
+            if parents:
+                parents[-1].remove(elem)
+
+
+def _child_texts(elem, names):
+    """Text of the first descendants of `elem` with the given local names."""
+    texts = dict.fromkeys(names)
+    for child in elem.iter():
+        name = _local_name(child.tag)
+        if name in texts and texts[name] is None:
+            texts[name] = child.text
+    return texts
+
+
+def _parse_times(texts):
+    times = pd.to_datetime(pd.Series(texts, dtype=object), utc=True, errors='coerce', format='ISO8601')
+    return times.dt.tz_localize(None).to_numpy(dtype='datetime64[ns]')
+
+
+def parse_gpx(gpx_file):
+    """Parse the track points of a GPX file, or its route points if it has no track."""
+    points = {'trkpt': ([], [], [], []), 'rtept': ([], [], [], [])}
+    for point in _iter_points(gpx_file, points):
+        lat, lon, ele, times = points[_local_name(point.tag)]
+        texts = _child_texts(point, ('ele', 'time'))
+        lat.append(point.get('lat', 'nan'))
+        lon.append(point.get('lon', 'nan'))
+        ele.append(texts['ele'] or 'nan')
+        times.append(texts['time'])
+    lat, lon, ele, times = points['trkpt'] if points['trkpt'][0] else points['rtept']
+    return _route(lat, lon, ele, _parse_times(times))
+
+
+def parse_tcx(tcx_file):
+    """Parse the track points of a TCX file."""
+    lat, lon, ele, times = [], [], [], []
+    names = ('LatitudeDegrees', 'LongitudeDegrees', 'AltitudeMeters', 'Time')
+    for point in _iter_points(tcx_file, ('Trackpoint',)):
+        texts = _child_texts(point, names)
+        lat.append(texts['LatitudeDegrees'] or 'nan')
+        lon.append(texts['LongitudeDegrees'] or 'nan')
+        ele.append(texts['AltitudeMeters'] or 'nan')
+        times.append(texts['Time'])
+    return _route(lat, lon, ele, _parse_times(times))
+
+
+def _fit_definition(data, pos, local_header):
+    """Decode a FIT definition message at `pos`; returns (definition, next position)."""
+    big_endian = data[pos + 1] == 1
+    global_num = struct.unpack_from('>H' if big_endian else '<H', data, pos + 2)[0]
+    n_fields = data[pos + 4]
+    pos += 5
+    wanted = {FIT_TIMESTAMP}
+    if global_num == FIT_RECORD:
+        wanted |= {FIT_LAT, FIT_LON, FIT_ALTITUDE, FIT_ENHANCED_ALTITUDE}
+
+    fmt, fields, invalid = ['>' if big_endian else '<'], [], []
+    for _ in range(n_fields):
+        field_num, size, base_type = data[pos], data[pos + 1], data[pos + 2]
+        pos += 3
+        code, bad = FIT_BASE_TYPES.get(base_type, (None, None))
+        if field_num in wanted and code is not None and struct.calcsize('<' + code) == size:
+            fmt.append(code)
+            fields.append(field_num)
+            invalid.append(bad)
+        else:
+            fmt.append(f'{size}x')
+    if local_header & 0x20:
+        # Developer fields: skipped
+        n_dev_fields = data[pos]
+        pos += 1
+        for _ in range(n_dev_fields):
+            fmt.append(f'{data[pos + 1]}x')
+            pos += 3
+    return (global_num, struct.Struct(''.join(fmt)), fields, invalid), pos
+
+
+def parse_fit(fit_data):
+    """Decode the record messages (track points) of a FIT file given as bytes."""
+    data = memoryview(fit_data)
+    header_size = data[0]
+    if len(data) < 12 or bytes(data[8:12]) != b'.FIT':
+        raise ValueError("Not a FIT file.")
+    data_size = struct.unpack_from('<I', data, 4)[0]
+    end = min(len(data), header_size + data_size)
+
+    definitions = {}
+    lat, lon, ele, times = [], [], [], []
+    last_timestamp = None
+    pos = header_size
+    while pos < end:
+        header = data[pos]
+        pos += 1
+        if header & 0x80:
+            # Compressed timestamp header: 5-bit offset from the last timestamp
+            local_num, offset = (header >> 5) & 0x03, header & 0x1F
+            if last_timestamp is not None:
+                timestamp = (last_timestamp & ~0x1F) + offset
+                if offset < (last_timestamp & 0x1F):
+                    timestamp += 0x20
+                last_timestamp = timestamp
+        elif header & 0x40:
+            definitions[header & 0x0F], pos = _fit_definition(data, pos, header)
+            continue
+        else:
+            local_num = header & 0x0F
+
+        definition = definitions.get(local_num)
+        if definition is None:
+            raise ValueError(f"FIT data message without definition at byte {pos - 1}.")
+        global_num, layout, fields, invalid = definition
+        values = {field: (None if value == bad else value)
+                  for field, value, bad in zip(fields, layout.unpack_from(data, pos), invalid)}
+        pos += layout.size
+
+        if values.get(FIT_TIMESTAMP) is not None:
+            last_timestamp = values[FIT_TIMESTAMP]
+        if global_num != FIT_RECORD:
+            continue
+        semicircles_lat, semicircles_lon = values.get(FIT_LAT), values.get(FIT_LON)
+        lat.append(np.nan if semicircles_lat is None else semicircles_lat * SEMICIRCLES_TO_DEGREES)
+        lon.append(np.nan if semicircles_lon is None else semicircles_lon * SEMICIRCLES_TO_DEGREES)
+        altitude = values.get(FIT_ENHANCED_ALTITUDE)
+        if altitude is None:
+            altitude = values.get(FIT_ALTITUDE)
+        ele.append(np.nan if altitude is None else altitude / 5 - 500)
+        times.append(-1 if last_timestamp is None else last_timestamp)
+
+    seconds = np.asarray(times, dtype=np.int64)
+    time = np.where(seconds >= 0, (seconds + FIT_EPOCH) * 10 ** 9, np.iinfo(np.int64).min).view('datetime64[ns]')
+    return _route(lat, lon, ele, time)
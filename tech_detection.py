@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+tech_detection.py
+
+Technology detection for project_dashboard.py's "Auto-detect Technologies".
+
+Keywords are compiled once, at import time, into a single regular expression
+with word boundaries, and applied to whole columns at once. Word boundaries
+avoid false hits such as 'eth' inside 'method' or 'ui' inside 'build', so
+the usual longer spellings of short keywords ('postgresql', 'mongodb',
+'nodejs', ...) are listed as keywords of their own.
+"""
+
+import re
+
+import pandas as pd
+
+# Dictionary mapping keywords to technologies
+TECH_KEYWORDS = {
+    # Frontend frameworks and libraries
+    'react': 'React',
+    'reactjs': 'React',
+    'vue': 'Vue.js',
+    'vuejs': 'Vue.js',
+    'angular': 'Angular',
+    'angularjs': 'Angular',
+    'svelte': 'Svelte',
+    'jquery': 'jQuery',
+    'backbone': 'Backbone.js',
+    'ember': 'Ember.js',
+
+    # Backend frameworks
+    'node': 'Node.js',
+    'nodejs': 'Node.js',
+    'express': 'Express.js',
+    'expressjs': 'Express.js',
+    'django': 'Django',
+    'flask': 'Flask',
+    'fastapi': 'FastAPI',
+    'rails': 'Ruby on Rails',
+    'symfony': 'Symfony',
+    'laravel': 'Laravel',
+    'spring': 'Spring',
+    'nestjs': 'NestJS',
+    'asp.net': 'ASP.NET',
+
+    # Languages
+    'php': 'PHP',
+    'python': 'Python',
+    'java': 'Java',
+    'javascript': 'JavaScript',
+    'typescript': 'TypeScript',
+    'go': 'Go',
+    'golang': 'Go',
+    'rust': 'Rust',
+    'c#': 'C#',
+    '.net': '.NET',
+    'ruby': 'Ruby',
+    'scala': 'Scala',
+    'elixir': 'Elixir',
+    'clojure': 'Clojure',
+    'haskell': 'Haskell',
+
+    # Frontend technologies
+    'html': 'HTML',
+    'css': 'CSS',
+    'sass': 'SASS',
+    'less': 'Less',
+    'bootstrap': 'Bootstrap',
+    'tailwind': 'Tailwind CSS',
+    'tailwindcss': 'Tailwind CSS',
+    'material': 'Material UI',
+    'bulma': 'Bulma',
+
+    # Databases
+    'mongo': 'MongoDB',
+    'mongodb': 'MongoDB',
+    'postgres': 'PostgreSQL',
+    'postgresql': 'PostgreSQL',
+    'mysql': 'MySQL',
+    'sql': 'SQL',
+    'redis': 'Redis',
+    'sqlite': 'SQLite',
+    'firestore': 'Firestore',
+    'dynamodb': 'DynamoDB',
+    'cassandra': 'Cassandra',
+    'couchdb': 'CouchDB',
+
+    # Infrastructure
+    'docker': 'Docker',
+    'kubernetes': 'Kubernetes',
+    'k8s': 'Kubernetes',
+    'aws': 'AWS',
+    'azure': 'Azure',
+    'gcp': 'GCP',
+    'heroku': 'Heroku',
+    'netlify': 'Netlify',
+    'vercel': 'Vercel',
+    'jenkins': 'Jenkins',
+    'gitlab': 'GitLab CI',
+    'github actions': 'GitHub Actions',
+
+    # Mobile
+    'android': 'Android',
+    'ios': 'iOS',
+    'swift': 'Swift',
+    'kotlin': 'Kotlin',
+    'flutter': 'Flutter',
+    'react native': 'React Native',
+    'expo': 'Expo',
+    'ionic': 'Ionic',
+    'xamarin': 'Xamarin',
+
+    # AI/ML
+    'tensorflow': 'TensorFlow',
+    'pytorch': 'PyTorch',
+    'keras': 'Keras',
+    'scikit': 'Scikit-learn',
+    'ml': 'Machine Learning',
+    'ai': 'AI',
+    'cv': 'Computer Vision',
+    'nlp': 'NLP',
+
+    # Blockchain
+    'blockchain': 'Blockchain',
+    'web3': 'Web3',
+    'eth': 'Ethereum',
+    'ethereum': 'Ethereum',
+    'solidity': 'Solidity',
+    'nft': 'NFT',
+    'nfts': 'NFT',
+    'bitcoin': 'Bitcoin',
+
+    # CMS
+    'wordpress': 'WordPress',
+    'drupal': 'Drupal',
+    'joomla': 'Joomla',
+    'contentful': 'Contentful',
+    'strapi': 'Strapi',
+
+    # Testing
+    'jest': 'Jest',
+    'cypress': 'Cypress',
+    'selenium': 'Selenium',
+    'playwright': 'Playwright',
+    'pytest': 'Pytest',
+    'junit': 'JUnit',
+
+    # APIs, platforms and other
+    'api': 'API',
+    'graphql': 'GraphQL',
+    'rest': 'REST API',
+    'gatsby': 'Gatsby',
+    'next': 'Next.js',
+    'nextjs': 'Next.js',
+    'nuxt': 'Nuxt.js',
+    'nuxtjs': 'Nuxt.js',
+    'firebase': 'Firebase',
+    'supabase': 'Supabase',
+    'stripe': 'Stripe',
+    'pwa': 'PWA',
+    'seo': 'SEO',
+    'ui': 'UI/UX',
+    'ux': 'UI/UX',
+    'design': 'Design',
+    'figma': 'Figma',
+    'websocket': 'WebSockets',
+    'websockets': 'WebSockets',
+    'socketio': 'Socket.IO',
+    'shadcn': 'shadcn/ui',
+}
+
+# Use category to infer technologies
+CATEGORY_TECH_MAP = {
+    'Web Development': ['HTML', 'CSS', 'JavaScript'],
+    'Mobile Development': ['Mobile'],
+    'Database': ['Database'],
+    'Machine Learning': ['Python', 'Machine Learning'],
+    'AI/ML': ['Python', 'AI', 'Machine Learning'],
+    'Data Science': ['Python', 'Data Analysis'],
+    'DevOps': ['Docker', 'CI/CD'],
+    'Blockchain': ['Blockchain', 'Smart Contracts'],
+}
+
+# One alternation for all keywords, longest first so that e.g. 'react native'
+# wins over 'react'. Keywords must not touch a letter or digit on either side.
+TECH_PATTERN = re.compile(
+    r'(?<![a-z0-9])(?:' +
+    '|'.join(re.escape(keyword) for keyword in sorted(TECH_KEYWORDS, key=len, reverse=True)) +
+    r')(?![a-z0-9])'
+)
+
+
+def _keyword_hits(texts):
+    """Technologies found in a column of texts, one row per (row, technology)."""
+    texts = texts.astype(object).where(texts.notna(), '').astype(str).str.lower()
+    return texts.str.findall(TECH_PATTERN).explode().dropna().map(TECH_KEYWORDS)
+
+
+def detect_technologies_batch(project_names, descriptions=None, categories=None):
+    """Detect technologies for whole columns at once.
+
+    Keywords are searched in the project names and descriptions, and
+    technologies implied by the category are added. Returns a Series aligned
+    with `project_names` holding comma-separated technologies (in order of
+    detection), or None where nothing was found.
+    """
+    index = project_names.index
+    positions = pd.RangeIndex(len(index))
+
+    hits = [_keyword_hits(project_names.set_axis(positions))]
+    if descriptions is not None:
+        hits.append(_keyword_hits(descriptions.set_axis(positions)))
+    if categories is not None:
+        hits.append(categories.set_axis(positions).astype(object).map(CATEGORY_TECH_MAP).dropna().explode())
+
+    found = pd.concat(hits)
+    if found.empty:
+        return pd.Series([None] * len(index), index=index, dtype=object)
+    found = found.to_frame('tech').rename_axis('row').reset_index().drop_duplicates()
+    joined = found.groupby('row', sort=False)['tech'].agg(', '.join)
+
+    result = joined.reindex(positions).astype(object)
+    return result.where(result.notna(), None).set_axis(index)
+
+
+def detect_technologies(project_name, description=None, category=None):
+    """Detect technologies for a single project; see detect_technologies_batch."""
+    return detect_technologies_batch(
+        pd.Series([project_name], dtype=object),
+        pd.Series([description], dtype=object),
+        pd.Series([category], dtype=object),
+    ).iloc[0]
+
+
+# Tech Stack values treated as "not known yet" by the auto-detect pipeline
+UNKNOWN_TECH_STACKS = ('Unknown', 'Inconnu', 'Multiple Technologies', '')
+
+
+def unknown_tech_stack_mask(df):
+    """Boolean mask of the rows whose Tech Stack is missing or unknown."""
+    if 'Tech Stack' not in df.columns:
+        return pd.Series(True, index=df.index)
+    tech_stacks = df['Tech Stack']
+    return tech_stacks.isna() | tech_stacks.isin(UNKNOWN_TECH_STACKS)
+
+
+def propose_tech_stacks(df):
+    """Run detection over every project with an unknown Tech Stack.
+
+    Returns a diff frame indexed like `df`, with one row per project for
+    which technologies were detected: 'Project Name', 'Current Tech Stack'
+    and 'Detected Tech Stack'.
+    """
+    mask = unknown_tech_stack_mask(df)
+    candidates = df[mask]
+
+    def column(name):
+        return candidates[name] if name in candidates.columns else None
+
+    names = column('Project Name')
+    if names is None:
+        names = pd.Series('', index=candidates.index, dtype=object)
+    detected = detect_technologies_batch(names, column('Résumé_Détaillé'), column('Category'))
+    found = detected.notna()
+
+    current = column('Tech Stack')
+    return pd.DataFrame({
+        'Project Name': names[found],
+        'Current Tech Stack': current[found] if current is not None else None,
+        'Detected Tech Stack': detected[found],
+    })
+
+
+def apply_tech_stack_changes(df, changes):
+    """Return a copy of `df` with the detected Tech Stacks of `changes` applied."""
+    updated_df = df.copy()
+    updated_df.loc[changes.index, 'Tech Stack'] = changes['Detected Tech Stack']
+    return updated_df
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from conftest import REPO_ROOT
+
+
+@pytest.fixture
+def dashboard(tmp_path, monkeypatch):
+    """AppTest of the full dashboard, run from a directory holding a small data file."""
+    pd.DataFrame({
+        'Project Name': ['Alpha', 'Beta', 'Gamma'],
+        'Category': ['Web', 'AI/ML', 'Web'],
+        'Status': ['Active', 'Active', 'Completed'],
+        'Priority': ['High', 'Low', 'Medium'],
+        'Tech Stack': ['Python', 'React', 'Go'],
+        'Last Updated': ['2024-01-15', '2024-02-01', pd.Timestamp.now().strftime('%Y-%m-%d')],
+    }).to_csv(tmp_path / 'Projects - full.csv', index=False)
+    monkeypatch.chdir(tmp_path)
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    yield AppTest.from_file(str(REPO_ROOT / 'project_dashboard.py'), default_timeout=60)
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def metric(at, label):
+    return next(m.value for m in at.metric if m.label == label)
+
+
+def test_main_shows_notifications(dashboard):
+    dashboard.run()
+    assert not dashboard.exception
+    assert metric(dashboard, "Unread") == '3'
+    assert metric(dashboard, "Not updated recently") == '2'
+    assert metric(dashboard, "High priority projects") == '1'
+    feed = dashboard.dataframe[-1].value
+    assert list(feed['Project']) == ['Alpha', 'Beta', 'Alpha']
+    assert feed['New'].all()
+
+
+def test_mark_all_notifications_as_read(dashboard, tmp_path):
+    dashboard.run()
+    next(b for b in dashboard.button if b.label == "Mark all notifications as read").click().run()
+    assert not dashboard.exception
+    assert metric(dashboard, "Unread") == '0'
+    assert not dashboard.dataframe[-1].value['New'].any()
+    # AppTest keeps the elements of the run that called st.rerun(); the next run shows the final page
+    dashboard.run()
+    assert "Mark all notifications as read" not in [b.label for b in dashboard.button]
+    assert (tmp_path / '.dashboard_cache' / 'notifications.db').exists()
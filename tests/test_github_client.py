@@ -0,0 +1,147 @@
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import github_client
+
+
+class StubGitHub(BaseHTTPRequestHandler):
+    """Answers with the responses queued for each path (an empty 200 by default) and logs every request.
+
+    Responses are (status, headers, JSON body) tuples; the last one of a path is repeated.
+    """
+
+    def _reply(self):
+        server = self.server
+        server.requests.append((self.command, self.path, dict(self.headers)))
+        server.release.wait(5)
+        responses = server.responses.get(self.path, [(200, {}, None)])
+        status, headers, body = responses.pop(0) if len(responses) > 1 else responses[0]
+        payload = json.dumps(body).encode() if body is not None and self.command != 'HEAD' else b''
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_HEAD = _reply
+    do_GET = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubGitHub)
+    server.requests = []
+    server.responses = {}
+    server.release = threading.Event()
+    server.release.set()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.release.set()
+    server.shutdown()
+    server.server_close()
+
+
+def test_existing_repository_is_valid(stub):
+    validator = github_client.GitHubURLValidator(base_url=stub.url)
+    assert validator.validate(stub.url + 'owner/repo') == github_client.VALID
+
+
+def test_missing_repository_is_invalid(stub):
+    stub.responses['/owner/missing'] = [(404, {}, None)]
+    validator = github_client.GitHubURLValidator(base_url=stub.url)
+    assert validator.check(stub.url + 'owner/missing') == github_client.PENDING
+    assert validator.wait(stub.url + 'owner/missing', timeout=5) == github_client.INVALID
+
+
+def test_unreachable_host_is_accepted():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}/"
+    validator = github_client.GitHubURLValidator(base_url=base_url)
+    assert validator.validate(base_url + 'owner/repo') == github_client.VALID
+
+
+def test_url_outside_base_url_is_invalid_without_request(stub):
+    validator = github_client.GitHubURLValidator(base_url=stub.url)
+    assert validator.check('https://example.com/owner/repo') == github_client.INVALID
+    assert stub.requests == []
+
+
+def test_check_returns_pending_then_serves_cached_result(stub):
+    url = stub.url + 'owner/repo'
+    validator = github_client.GitHubURLValidator(base_url=stub.url)
+    stub.release.clear()
+    assert validator.check(url) == github_client.PENDING
+    assert validator.status(url) == github_client.PENDING
+    stub.release.set()
+    assert validator.wait(url, timeout=5) == github_client.VALID
+
+    assert validator.check(url) == github_client.VALID
+    assert len(stub.requests) == 1
+
+
+REPO = {'stargazers_count': 42, 'forks_count': 7, 'open_issues_count': 3}
+
+
+@pytest.fixture
+def fetcher(stub, tmp_path):
+    return github_client.GitHubMetadataFetcher(cache_file=tmp_path / 'github_metadata.json',
+                                               api_url=stub.url, token='', ttl=3600)
+
+
+def test_fetch_then_not_modified(stub, fetcher, tmp_path):
+    url = 'https://github.com/owner/repo'
+    stub.responses['/repos/owner/repo'] = [(200, {'ETag': '"v1"'}, REPO), (304, {}, None)]
+    assert fetcher.refresh([url]) == 1
+    stats = {'stars': 42, 'forks': 7, 'open_issues': 3}
+    assert fetcher.cached_stats([url]) == {url: stats}
+    assert 'If-None-Match' not in stub.requests[0][2]
+
+    # Fresh entries are not fetched again
+    assert fetcher.refresh([url]) == 0
+    assert len(stub.requests) == 1
+
+    # Once stale, the next request is conditional and a 304 keeps the cached stats
+    fetcher.ttl = 0
+    assert fetcher.refresh([url]) == 1
+    assert stub.requests[1][2]['If-None-Match'] == '"v1"'
+    assert fetcher.cached_stats([url]) == {url: stats}
+
+    # The cache survives a restart
+    reloaded = github_client.GitHubMetadataFetcher(cache_file=tmp_path / 'github_metadata.json', api_url=stub.url)
+    assert reloaded.cached_stats([url]) == {url: stats}
+
+
+def test_server_error_is_retried(stub, fetcher):
+    url = 'https://github.com/owner/flaky'
+    stub.responses['/repos/owner/flaky'] = [(500, {}, None), (200, {'ETag': '"v1"'}, REPO)]
+    assert fetcher.refresh([url]) == 1
+    assert len(stub.requests) == 2
+    assert fetcher.cached_stats([url])[url]['stars'] == 42
+
+
+def test_unknown_repository_is_cached_without_stats(stub, fetcher):
+    url = 'https://github.com/owner/missing'
+    stub.responses['/repos/owner/missing'] = [(404, {}, {'message': 'Not Found'})]
+    assert fetcher.refresh([url]) == 1
+    assert fetcher.cached_stats([url]) == {}
+    assert fetcher.stale_repos([url]) == []
+    assert len(stub.requests) == 1
+
+
+def test_token_is_sent(stub, tmp_path):
+    fetcher = github_client.GitHubMetadataFetcher(cache_file=tmp_path / 'github_metadata.json',
+                                                  api_url=stub.url, token='secret')
+    fetcher.refresh(['https://github.com/owner/repo'])
+    assert stub.requests[0][2]['Authorization'] == 'Bearer secret'
@@ -0,0 +1,38 @@
+import gc
+import os
+
+import pandas as pd
+
+import report_export
+
+PROJECTS = pd.DataFrame({
+    'Project Name': ['Alpha', 'Bêta ✓'],
+    'Status': ['Active', None],
+    'Priority': ['High', 'Low'],
+})
+
+
+def test_evicted_report_stays_readable_while_held(tmp_path):
+    exporter = report_export.ReportExporter(export_dir=str(tmp_path), max_entries=1)
+    first = exporter.submit('first', PROJECTS)
+    path = first.result(timeout=30)
+    exporter.submit('second', PROJECTS).result(timeout=30)
+
+    assert exporter.get('first') is None
+    with open(path, 'rb') as pdf_file:
+        assert pdf_file.read(5) == b'%PDF-'
+
+    del first
+    gc.collect()
+    assert not os.path.exists(path)
+
+
+def test_failed_report_leaves_no_file_and_is_rebuilt(tmp_path):
+    exporter = report_export.ReportExporter(export_dir=str(tmp_path))
+    failed = exporter.submit('view', None)
+    assert failed.exception(timeout=30) is not None
+    assert os.listdir(tmp_path) == []
+
+    rebuilt = exporter.submit('view', PROJECTS)
+    assert rebuilt is not failed
+    assert os.path.exists(rebuilt.result(timeout=30))
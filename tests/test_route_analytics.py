@@ -0,0 +1,51 @@
+import pytest
+
+import route_analytics
+from cycling_routes import load_route
+
+GPX = b"""<?xml version="1.0"?>
+<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk><trkseg>
+    <trkpt lat="45.0000" lon="5.0000"><time>2024-05-01T10:00:00Z</time></trkpt>
+    <trkpt lat="45.0010" lon="5.0000"></trkpt>
+    <trkpt lat="45.0020" lon="5.0000"><time>2024-05-01T10:00:20Z</time></trkpt>
+    <trkpt lat="45.0030" lon="5.0000"><time>2024-05-01T10:00:30Z</time></trkpt>
+  </trkseg></trk>
+</gpx>
+"""
+
+CSV = b"""lat,lon,time
+45.0000,5.0000,
+45.0010,5.0000,2024-05-01T10:00:10Z
+45.0020,5.0000,2024-05-01T10:00:20Z
+45.0030,5.0000,not a time
+"""
+
+
+def test_gpx_point_without_time():
+    stats = route_analytics.analyze_route(load_route(GPX, 'ride.gpx'))
+    # Only the last segment has times at both ends
+    assert stats['elapsed_s'] == 30.0
+    assert stats['moving_s'] == 10.0
+    segment = route_analytics.haversine(45.0020, 5.0, 45.0030, 5.0)
+    # Coordinates are stored as float32
+    assert stats['avg_speed_kmh'] == pytest.approx(segment / 10 * 3.6, rel=1e-3)
+    assert stats['max_speed_kmh'] == pytest.approx(stats['avg_speed_kmh'])
+
+
+def test_csv_blank_and_invalid_time_cells():
+    stats = route_analytics.analyze_route(load_route(CSV, 'ride.csv'))
+    # Measured from the first valid time, not from the missing first one
+    assert stats['elapsed_s'] == 10.0
+    assert stats['moving_s'] == 10.0
+    assert 0 < stats['max_speed_kmh'] < 100
+    assert route_analytics.format_duration(stats['elapsed_s']) == "0:00:10"
+
+
+def test_route_without_valid_time():
+    data = b"lat,lon,time\n45.0,5.0,\n45.001,5.0,\n"
+    stats = route_analytics.analyze_route(load_route(data, 'ride.csv'))
+    assert stats['distance_m'] > 0
+    assert stats['elapsed_s'] is None
+    assert stats['moving_s'] is None
+    assert stats['max_speed_kmh'] is None
@@ -0,0 +1,34 @@
+import pandas as pd
+import pytest
+
+import tech_detection
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('PostgreSQL backend with MongoDB', 'PostgreSQL, MongoDB'),
+    ('Bridge between ethereum testnets', 'Ethereum'),
+    ('Chat over websockets', 'WebSockets'),
+    ('Styled with TailwindCSS', 'Tailwind CSS'),
+    ('Backend on NodeJS', 'Node.js'),
+    ('ReactJS front, NextJS SSR', 'React, Next.js'),
+    ('VueJS widgets', 'Vue.js'),
+    ('Node.js and React Native app', 'Node.js, React Native'),
+])
+def test_keywords_and_full_spellings(text, expected):
+    assert tech_detection.detect_technologies(text) == expected
+
+
+@pytest.mark.parametrize('text', ['A method to build things', 'Methodology', 'Rebuild'])
+def test_keywords_inside_words_are_ignored(text):
+    assert tech_detection.detect_technologies(text) is None
+
+
+def test_batch_matches_single_detection():
+    names = pd.Series(['Shop', 'Merge-Testnets', 'Notes'], index=[10, 20, 30])
+    descriptions = pd.Series(['Stripe checkout in Next.js', 'Syncs ethereum nodes', None], index=names.index)
+    categories = pd.Series([None, 'Blockchain', None], index=names.index)
+    detected = tech_detection.detect_technologies_batch(names, descriptions, categories)
+    assert detected.index.tolist() == [10, 20, 30]
+    assert detected[10] == tech_detection.detect_technologies('Shop', 'Stripe checkout in Next.js')
+    assert detected[20] == 'Ethereum, Blockchain, Smart Contracts'
+    assert detected[30] is None